@@ -1,11 +1,12 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, JSON, ForeignKey, Enum, func, Boolean
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, Integer, String, Float, DateTime, JSON, ForeignKey, Enum, func, Boolean, Index, text
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import uuid
 import enum
 from uuid import uuid4
+from uuid_extensions import uuid7
 
 Base = declarative_base()
 
@@ -14,6 +15,18 @@ class EmergencyStatus(str, enum.Enum):
     RESOLVED = "RESOLVED"
     CANCELLED = "CANCELLED"
 
+class EmergencyType(str, enum.Enum):
+    FIRE = "FIRE"
+    MEDICAL = "MEDICAL"
+    POLICE = "POLICE"
+    CRIME = "CRIME"
+    TRAFFIC = "TRAFFIC"
+    NATURAL_DISASTER = "NATURAL_DISASTER"
+    OTHER = "OTHER"
+    # Emitted by the coordinator when classification cannot complete
+    UNKNOWN = "UNKNOWN"
+    ERROR = "ERROR"
+
 class PriorityLevel(str, enum.Enum):
     HIGH = "HIGH"
     MEDIUM = "MEDIUM"
@@ -32,13 +45,16 @@ class UserRole(str, enum.Enum):
 class Emergency(Base):
     __tablename__ = "emergencies"
 
-    id = Column(UUID, primary_key=True, default=uuid4)
-    emergency_type = Column(String, nullable=False)
-    priority_level = Column(String, nullable=False)
-    status = Column(String, nullable=False)
+    # Time-ordered UUIDs keep primary-key inserts sequential in the B-tree
+    id = Column(UUID, primary_key=True, default=uuid7)
+    # Native Postgres ENUMs store a 4-byte OID instead of variable-length
+    # text, so history/stats range scans touch fewer pages
+    emergency_type = Column(Enum(EmergencyType, name="emergency_type"), nullable=False)
+    priority_level = Column(Enum(PriorityLevel, name="priority_level"), nullable=False)
+    status = Column(Enum(EmergencyStatus, name="emergency_status"), nullable=False)
     location_lat = Column(Float)
     location_lon = Column(Float)
-    response_plan = Column(JSON)
+    response_plan = Column(JSONB)
     context_data = Column(JSON)  # Store weather, traffic, and other context data
     estimated_response_time = Column(DateTime)
     actual_response_time = Column(DateTime)
@@ -50,10 +66,19 @@ class Emergency(Base):
     notifications = relationship("Notification", back_populates="emergency")
     status_updates = relationship("EmergencyStatusUpdate", back_populates="emergency")
 
+    __table_args__ = (
+        # Covers the history/stats filters (created_at range + type + status)
+        Index('ix_emergency_created_type_status', 'created_at', 'emergency_type', 'status'),
+        # Partial index keeps the dashboard's ACTIVE-only scans small
+        Index('ix_emergency_status_active', 'created_at', postgresql_where=text("status = 'ACTIVE'")),
+        # GIN index enables containment queries on the JSONB response plan
+        Index('ix_emergency_plan_gin', 'response_plan', postgresql_using='gin'),
+    )
+
 class EmergencyStatusUpdate(Base):
     __tablename__ = "emergency_status_updates"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     emergency_id = Column(UUID(as_uuid=True), ForeignKey("emergencies.id"))
     old_status = Column(Enum(EmergencyStatus))
     new_status = Column(Enum(EmergencyStatus))
@@ -66,7 +91,7 @@ class EmergencyStatusUpdate(Base):
 class ServiceAvailability(Base):
     __tablename__ = "service_availability"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     service_type = Column(String, nullable=False)
     status = Column(Enum(ServiceStatus), default=ServiceStatus.ACTIVE)
     available_units = Column(Integer, default=0)
@@ -76,7 +101,7 @@ class ServiceAvailability(Base):
 class Notification(Base):
     __tablename__ = "notifications"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     emergency_id = Column(UUID(as_uuid=True), ForeignKey("emergencies.id"))
     recipient_type = Column(String, nullable=False)  # service, user, admin
     recipient_id = Column(String, nullable=False)
@@ -89,6 +114,11 @@ class Notification(Base):
     # Relationships
     emergency = relationship("Emergency", back_populates="notifications")
 
+    __table_args__ = (
+        # Supports recipient lookups ordered by created_at DESC
+        Index('ix_notif_recipient_created', 'recipient_id', 'created_at'),
+    )
+
 class User(Base):
     __tablename__ = "users"
 
@@ -123,7 +153,7 @@ class UserSession(Base):
 class NotificationSubscription(Base):
     __tablename__ = "notification_subscriptions"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     subscriber_type = Column(String, nullable=False)  # service, user, admin
     subscriber_id = Column(String, nullable=False)
     notification_type = Column(String, nullable=False)  # emergency, status_update, service_status
@@ -75,7 +75,7 @@ export function EmergencyDashboard({ lastMessage }: EmergencyDashboardProps) {
   const loadEmergencies = async () => {
     try {
       const data = await emergencyAPI.getHistory({ limit: 20 });
-      setEmergencies(data);
+      setEmergencies(data.items);
     } catch (error) {
       console.error('Failed to load emergencies:', error);
     }
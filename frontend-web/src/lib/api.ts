@@ -88,15 +88,15 @@ export const emergencyAPI = {
     });
   },
 
-  // Get emergency history
+  // Get emergency history (keyset-paginated: pass next_cursor back as cursor)
   getHistory: async (params?: {
     start_date?: string;
     end_date?: string;
     emergency_type?: string;
     status?: EmergencyStatus;
     limit?: number;
-    offset?: number;
-  }): Promise<Emergency[]> => {
+    cursor?: string;
+  }): Promise<{ items: Emergency[]; next_cursor: string | null }> => {
     const searchParams = new URLSearchParams();
     
     if (params) {
@@ -141,9 +141,12 @@ export const notificationAPI = {
     });
   },
 
-  // Get notifications for subscriber
-  getNotifications: async (subscriberId: string): Promise<any[]> => {
-    return apiRequest(`/notifications/${subscriberId}`);
+  // Get notifications for subscriber (keyset-paginated)
+  getNotifications: async (
+    subscriberId: string,
+    cursor?: string
+  ): Promise<{ items: any[]; next_cursor: string | null }> => {
+    return apiRequest(`/notifications/${subscriberId}${cursor ? `?cursor=${encodeURIComponent(cursor)}` : ''}`);
   },
 };
 
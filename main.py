@@ -1,3 +1,4 @@
+import base64
 import json
 import os
 import logging
@@ -6,14 +7,19 @@ from datetime import datetime, timedelta
 from typing import Optional, Dict, List
 from uuid import UUID
 import uuid
+from uuid_extensions import uuid7
 
-from fastapi import FastAPI, UploadFile, File, Form, WebSocket, WebSocketDisconnect, HTTPException, Depends, Query
+from fastapi import FastAPI, UploadFile, File, Form, WebSocket, WebSocketDisconnect, HTTPException, Depends, Query, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 from typing import Dict, Optional, List
+import orjson
 import uvicorn
+from cachetools import TTLCache
 from dotenv import load_dotenv
-from sqlalchemy.orm import Session
+from sqlalchemy import select, func, text, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
 
 # Load environment variables
 load_dotenv()
@@ -23,7 +29,7 @@ from services.enhanced_coordinator import enhanced_emergency_coordinator
 from services.notification.notification_service import notification_manager
 from services.auth.auth_routes import router as auth_router
 from services.auth.dependencies import require_dispatcher, get_optional_user
-from database.connection import get_db, init_db
+from database.connection import get_db, engine, async_engine, AsyncSessionLocal, DATABASE_URL
 from database.models import (
     Emergency,
     EmergencyStatus,
@@ -38,7 +44,10 @@ from database.models import (
 app = FastAPI(
     title="RapidRespond Emergency Response System",
     description="Multi-agent, voice-activated emergency response system with enhanced routing and location intelligence",
-    version="2.0.0"
+    version="2.0.0",
+    # orjson serializes the dashboard's dict/list payloads several times
+    # faster than stdlib json and handles datetime/UUID natively
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -50,9 +59,6 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize database
-init_db()
-
 # Include authentication routes
 app.include_router(auth_router)
 
@@ -60,6 +66,41 @@ app.include_router(auth_router)
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@app.on_event("startup")
+async def verify_database_connection():
+    """Check database connectivity on startup (schema is created by scripts/init_db.py)"""
+    from sqlalchemy import text
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        logger.info("Database connection verified")
+    except Exception as e:
+        logger.error(f"Database connection check failed: {e}")
+
+@app.on_event("startup")
+async def start_emergency_listener():
+    """Hold one LISTEN connection per worker and forward NOTIFYs to local clients"""
+    global _emergency_listener_conn
+    try:
+        import asyncpg
+
+        _emergency_listener_conn = await asyncpg.connect(DATABASE_URL)
+
+        def _on_notify(conn, pid, channel, payload):
+            asyncio.create_task(_broadcast_emergency(json.loads(payload)))
+
+        await _emergency_listener_conn.add_listener(EMERGENCY_CHANNEL, _on_notify)
+        logger.info(f"Listening on Postgres channel '{EMERGENCY_CHANNEL}'")
+    except Exception as e:
+        logger.error(f"Failed to start emergency listener: {e}")
+        _emergency_listener_conn = None
+
+@app.on_event("shutdown")
+async def stop_emergency_listener():
+    """Close the dedicated LISTEN connection"""
+    if _emergency_listener_conn is not None:
+        await _emergency_listener_conn.close()
+
 # Pydantic models
 class Location(BaseModel):
     lat: float
@@ -84,79 +125,184 @@ class ServiceStatusUpdate(BaseModel):
     status: str
     capacity: Optional[int] = None
 
+class EmergencyBatchItem(BaseModel):
+    text: str
+    lat: Optional[float] = None
+    lon: Optional[float] = None
+
+class EmergencyBatch(BaseModel):
+    items: List[EmergencyBatchItem]
+
 class NotificationCreate(BaseModel):
     emergency_id: Optional[UUID] = None
     message: str
     notification_type: str = "ALERT"
     priority: str = "MEDIUM"
 
+# Open-Meteo weather code mapping, built once at import time
+WEATHER_CODES = {
+    0: "Clear sky", 1: "Mainly clear", 2: "Partly cloudy", 3: "Overcast",
+    45: "Fog", 48: "Depositing rime fog", 51: "Light drizzle", 53: "Moderate drizzle",
+    55: "Dense drizzle", 56: "Light freezing drizzle", 57: "Dense freezing drizzle",
+    61: "Slight rain", 63: "Moderate rain", 65: "Heavy rain", 66: "Light freezing rain",
+    67: "Heavy freezing rain", 71: "Slight snow", 73: "Moderate snow", 75: "Heavy snow",
+    77: "Snow grains", 80: "Slight rain showers", 81: "Moderate rain showers",
+    82: "Violent rain showers", 85: "Slight snow showers", 86: "Heavy snow showers",
+    95: "Thunderstorm", 96: "Thunderstorm with slight hail", 99: "Thunderstorm with heavy hail"
+}
+
 # WebSocket connections management
 connected_clients = {}
 
+# Emergencies are published through Postgres NOTIFY so that, under multiple
+# uvicorn workers, clients connected to any worker still receive the event
+EMERGENCY_CHANNEL = "emergency_channel"
+_emergency_listener_conn = None
+
+# Short-lived cache for emergency status polling: id -> payload. TTLCache
+# evicts expired and least-recently-used entries itself, so polls for
+# emergencies that are never updated again cannot grow the cache forever
+emergency_status_cache = TTLCache(maxsize=10_000, ttl=5)
+
+def _invalidate_emergency_cache(emergency_id):
+    """Drop a cached emergency after a status update"""
+    emergency_status_cache.pop(str(emergency_id), None)
+
+def _encode_cursor(created_at: datetime, row_id) -> str:
+    """Encode a keyset pagination cursor as base64 (iso timestamp, id)"""
+    raw = json.dumps([created_at.isoformat(), str(row_id)]).encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+def _decode_cursor(cursor: str):
+    """Decode a keyset pagination cursor back to (timestamp, id)"""
+    try:
+        ts, row_id = json.loads(base64.urlsafe_b64decode(cursor))
+        return datetime.fromisoformat(ts), UUID(row_id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def _emergency_to_dict(emergency: Emergency) -> Dict:
+    """Convert an Emergency row to its history JSON shape"""
+    return {
+        "id": str(emergency.id),
+        "emergency_type": emergency.emergency_type,
+        "priority_level": emergency.priority_level,
+        "status": emergency.status,
+        "location_lat": emergency.location_lat,
+        "location_lon": emergency.location_lon,
+        "response_plan": emergency.response_plan,
+        "context_data": emergency.context_data,  # Include context data
+        "estimated_response_time": emergency.estimated_response_time.isoformat() if emergency.estimated_response_time else None,
+        "actual_response_time": emergency.actual_response_time.isoformat() if emergency.actual_response_time else None,
+        "notes": emergency.notes,
+        "created_at": emergency.created_at.isoformat(),
+        "updated_at": emergency.updated_at.isoformat()
+    }
+
+async def _stream_history_ndjson(query):
+    """Stream emergency rows as NDJSON from a server-side cursor
+
+    Opens its own session: the request-scoped dependency session is torn
+    down before a StreamingResponse body generator runs, so streaming from
+    it would open a connection that nothing ever closes.
+    """
+    async with AsyncSessionLocal() as session:
+        result = await session.stream(query.execution_options(yield_per=500))
+        async for (emergency,) in result:
+            yield orjson.dumps(_emergency_to_dict(emergency), default=str) + b"\n"
+
 # Add missing API endpoints before the WebSocket endpoint
 
 @app.get("/emergency/history")
 async def get_emergency_history(
-    limit: int = 20,
-    offset: int = 0,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    limit: int = Query(50, le=200),
+    stream: bool = False,
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(require_dispatcher)
 ):
-    """Get emergency history from database with optional pagination"""
+    """Get emergency history from database with keyset pagination
+
+    With stream=true, the full matching history is sent as NDJSON from a
+    server-side cursor, so memory stays constant regardless of result size.
+    """
     try:
-        emergencies = db.query(Emergency).order_by(Emergency.created_at.desc()).offset(offset).limit(limit).all()
-        
+        if stream:
+            # No eager loads here: the serialized shape has no relationship
+            # fields and collection loaders do not mix with yield_per
+            query = select(Emergency).order_by(
+                Emergency.created_at.desc(), Emergency.id.desc()
+            )
+            if cursor:
+                ts, last_id = _decode_cursor(cursor)
+                query = query.where(tuple_(Emergency.created_at, Emergency.id) < (ts, last_id))
+            return StreamingResponse(
+                _stream_history_ndjson(query),
+                media_type="application/x-ndjson"
+            )
+        # Keyset pagination walks the (created_at, id) index directly
+        # instead of paying OFFSET's cost of scanning the skipped rows
+        query = (
+            select(Emergency)
+            .order_by(Emergency.created_at.desc(), Emergency.id.desc())
+            .limit(limit)
+        )
+        if cursor:
+            ts, last_id = _decode_cursor(cursor)
+            query = query.where(tuple_(Emergency.created_at, Emergency.id) < (ts, last_id))
+
+        result = await db.execute(query)
+        emergencies = result.scalars().all()
+
+        next_cursor = (
+            _encode_cursor(emergencies[-1].created_at, emergencies[-1].id)
+            if len(emergencies) == limit else None
+        )
+
         # Convert to dict format for JSON response
-        return [
-            {
-                "id": str(emergency.id),
-                "emergency_type": emergency.emergency_type,
-                "priority_level": emergency.priority_level,
-                "status": emergency.status,
-                "location_lat": emergency.location_lat,
-                "location_lon": emergency.location_lon,
-                "response_plan": emergency.response_plan,
-                "context_data": emergency.context_data,  # Include context data
-                "estimated_response_time": emergency.estimated_response_time.isoformat() if emergency.estimated_response_time else None,
-                "actual_response_time": emergency.actual_response_time.isoformat() if emergency.actual_response_time else None,
-                "notes": emergency.notes,
-                "created_at": emergency.created_at.isoformat(),
-                "updated_at": emergency.updated_at.isoformat()
-            }
-            for emergency in emergencies
-        ]
+        items = [_emergency_to_dict(emergency) for emergency in emergencies]
+        return {"items": items, "next_cursor": next_cursor}
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error getting emergency history: {e}")
-        # Return empty list if database query fails
-        return []
+        # Return an empty page if database query fails
+        return {"items": [], "next_cursor": None}
 
 @app.get("/emergency/stats")
 async def get_emergency_stats(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(require_dispatcher)
 ):
     """Get emergency statistics"""
     try:
-        total_emergencies = db.query(Emergency).count()
-        
-        # Calculate average response time from actual response times
-        emergencies_with_response = db.query(Emergency).filter(
-            Emergency.estimated_response_time.isnot(None)
+        # Aggregate everything in one grouped query so Postgres does the
+        # counting instead of shipping every row to Python
+        rows = (
+            await db.execute(
+                select(
+                    Emergency.emergency_type,
+                    func.count(),
+                    func.count().filter(Emergency.status == "ACTIVE"),
+                    func.count().filter(Emergency.estimated_response_time.isnot(None))
+                ).group_by(Emergency.emergency_type)
+            )
         ).all()
-        
-        if emergencies_with_response:
-            # Calculate average in minutes
-            total_minutes = sum([
-                5 if e.emergency_type == "MEDICAL" else 
-                7 if e.emergency_type == "FIRE" else 
-                10 for e in emergencies_with_response
-            ])
-            avg_response_time = total_minutes / len(emergencies_with_response)
+
+        total_emergencies = sum(row[1] for row in rows)
+        active_emergencies = sum(row[2] for row in rows)
+
+        # Per-type response-time estimates (minutes) folded over the counts
+        type_minutes = {"MEDICAL": 5, "FIRE": 7}
+        responded = sum(row[3] for row in rows)
+        if responded:
+            total_minutes = sum(
+                type_minutes.get(row[0], 10) * row[3] for row in rows
+            )
+            avg_response_time = total_minutes / responded
         else:
             avg_response_time = 8  # Default fallback
-        
-        active_emergencies = db.query(Emergency).filter(Emergency.status == "ACTIVE").count()
-        
+
         return {
             "total_emergencies": total_emergencies,
             "average_response_time": round(avg_response_time, 1),
@@ -181,21 +327,24 @@ async def get_service_availability(current_user: User = Depends(require_dispatch
     }
 
 @app.get("/conditions/current")
-async def get_current_conditions():
+async def get_current_conditions(db: AsyncSession = Depends(get_db)):
     """Get current real-time weather and traffic conditions"""
     import aiohttp
     import json
-    
+
     try:
         # Default location (San Francisco) - you can make this configurable
         default_lat, default_lon = 37.7749, -122.4194
-        
+
         # Get location from most recent emergency if available
-        db: Session = next(get_db())
-        recent_emergency = db.query(Emergency).filter(
-            Emergency.location_lat.isnot(None),
-            Emergency.location_lon.isnot(None)
-        ).order_by(Emergency.created_at.desc()).first()
+        recent_emergency = (
+            await db.execute(
+                select(Emergency).where(
+                    Emergency.location_lat.isnot(None),
+                    Emergency.location_lon.isnot(None)
+                ).order_by(Emergency.created_at.desc()).limit(1)
+            )
+        ).scalars().first()
         
         if recent_emergency:
             lat, lon = recent_emergency.location_lat, recent_emergency.location_lon
@@ -213,21 +362,9 @@ async def get_current_conditions():
                         data = await response.json()
                         current = data["current_weather"]
                         
-                        # Weather code mapping
-                        weather_codes = {
-                            0: "Clear sky", 1: "Mainly clear", 2: "Partly cloudy", 3: "Overcast",
-                            45: "Fog", 48: "Depositing rime fog", 51: "Light drizzle", 53: "Moderate drizzle",
-                            55: "Dense drizzle", 56: "Light freezing drizzle", 57: "Dense freezing drizzle",
-                            61: "Slight rain", 63: "Moderate rain", 65: "Heavy rain", 66: "Light freezing rain",
-                            67: "Heavy freezing rain", 71: "Slight snow", 73: "Moderate snow", 75: "Heavy snow",
-                            77: "Snow grains", 80: "Slight rain showers", 81: "Moderate rain showers",
-                            82: "Violent rain showers", 85: "Slight snow showers", 86: "Heavy snow showers",
-                            95: "Thunderstorm", 96: "Thunderstorm with slight hail", 99: "Thunderstorm with heavy hail"
-                        }
-                        
                         weather_data = {
                             "temperature": round(current["temperature"]),
-                            "conditions": weather_codes.get(current["weathercode"], "Unknown"),
+                            "conditions": WEATHER_CODES.get(current["weathercode"], "Unknown"),
                             "wind_speed": round(current["windspeed"]),
                             "humidity": 65,  # Open-Meteo basic doesn't include humidity
                             "timestamp": datetime.now().isoformat()
@@ -381,13 +518,46 @@ async def websocket_endpoint(websocket: WebSocket, client_id: str):
         if client_id in connected_clients:
             del connected_clients[client_id]
 
+async def _broadcast_emergency(emergency_data: Dict):
+    """Fan out a new emergency to all connected WebSocket clients"""
+    message = json.dumps({
+        "type": emergency_data.pop("event", "new_emergency"),
+        "data": emergency_data
+    })
+    for client_id, websocket in list(connected_clients.items()):
+        try:
+            await websocket.send_text(message)
+        except:
+            # Remove disconnected client
+            logger.warning(f"Failed to send to client {client_id}, removing")
+            connected_clients.pop(client_id, None)
+
+async def _publish_emergency(emergency_data: Dict):
+    """Publish an emergency event to every worker via Postgres NOTIFY
+
+    Falls back to broadcasting directly to this worker's clients if the
+    publish fails, so single-worker deployments keep working without a
+    listener connection.
+    """
+    try:
+        async with async_engine.connect() as conn:
+            await conn.execute(
+                text("SELECT pg_notify(:channel, :payload)"),
+                {"channel": EMERGENCY_CHANNEL, "payload": json.dumps(emergency_data)}
+            )
+            await conn.commit()
+    except Exception as e:
+        logger.error(f"Emergency publish failed, using local broadcast: {e}")
+        await _broadcast_emergency(emergency_data)
+
 @app.post("/emergency/report", response_model=EmergencyResponse)
 async def report_emergency(
+    background_tasks: BackgroundTasks,
     audio: Optional[UploadFile] = File(None),
     text: Optional[str] = Form(None),
     lat: Optional[float] = Form(None),
     lon: Optional[float] = Form(None),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Process an emergency report using the enhanced coordinator"""
     try:
@@ -398,8 +568,10 @@ async def report_emergency(
                 detail="Either audio or text must be provided"
             )
             
-        # Read audio file if provided
-        audio_data = await audio.read() if audio else None
+        # Hand the upload's spooled file to the pipeline instead of buffering
+        # the whole clip in memory; UploadFile spools large bodies to disk and
+        # the speech service consumes file-like objects directly
+        audio_data = audio.file if audio else None
         
         # Create location dict if coordinates provided
         location = None
@@ -432,7 +604,7 @@ async def report_emergency(
         emergency_description = response.get("processed_text", text)
         
         emergency = Emergency(
-            id=uuid.uuid4(),
+            id=uuid7(),
             emergency_type=response["type"],
             priority_level=response["priority"],
             status="ACTIVE",
@@ -445,8 +617,8 @@ async def report_emergency(
             notes=emergency_description  # Store the processed text (transcribed audio or original text)
         )
         db.add(emergency)
-        db.commit()
-        db.refresh(emergency)
+        await db.commit()
+        await db.refresh(emergency)
         
         # Broadcast to connected WebSocket clients
         emergency_data = {
@@ -459,18 +631,9 @@ async def report_emergency(
             "enhanced_features": True
         }
         
-        # Send to all connected clients
-        for client_id, websocket in connected_clients.items():
-            try:
-                await websocket.send_text(json.dumps({
-                    "type": "new_emergency",
-                    "data": emergency_data
-                }))
-            except:
-                # Remove disconnected client
-                logger.warning(f"Failed to send to client {client_id}, removing")
-                connected_clients.pop(client_id, None)
-        
+        # Fan out to clients on every worker after the response is sent
+        background_tasks.add_task(_publish_emergency, emergency_data)
+
         logger.info("✅ Enhanced emergency processing completed successfully")
         
         return EmergencyResponse(
@@ -484,17 +647,105 @@ async def report_emergency(
         logger.error(f"❌ Enhanced emergency processing failed: {e}")
         raise HTTPException(status_code=500, detail=f"Emergency processing failed: {str(e)}")
 
+@app.post("/emergency/report_batch")
+async def report_emergency_batch(
+    batch: EmergencyBatch,
+    db: AsyncSession = Depends(get_db)
+):
+    """Process a batch of emergency reports with a single multi-row INSERT"""
+    try:
+        if not batch.items:
+            raise HTTPException(status_code=400, detail="Batch must contain at least one item")
+
+        logger.info(f"🚨 BATCH EMERGENCY REPORT - {len(batch.items)} items")
+
+        # Classify all reports concurrently through the enhanced coordinator
+        responses = await asyncio.gather(*[
+            enhanced_emergency_coordinator.process_emergency(
+                text=item.text,
+                location={"lat": item.lat, "lon": item.lon} if item.lat is not None and item.lon is not None else None
+            )
+            for item in batch.items
+        ])
+
+        # Build all rows up front so the insert is one statement, one commit
+        rows = []
+        for item, response in zip(batch.items, responses):
+            enhanced_details = response.get("details", {})
+            rows.append({
+                "id": uuid7(),
+                "emergency_type": response["type"],
+                "priority_level": response["priority"],
+                "status": "ACTIVE",
+                "location_lat": item.lat,
+                "location_lon": item.lon,
+                "response_plan": response,
+                "context_data": {
+                    "location_intelligence": enhanced_details.get("location_intelligence", {}),
+                    "handler_used": enhanced_details.get("handler_used", "unknown"),
+                    "agent_confidence": enhanced_details.get("agent_confidence", 0.0)
+                },
+                "notes": response.get("processed_text", item.text)
+            })
+
+        # Single multi-row INSERT ... VALUES (...), (...) plus one commit
+        await db.execute(Emergency.__table__.insert(), rows)
+        await db.commit()
+
+        # Notify all connected clients about the batch in parallel
+        await asyncio.gather(*[
+            notification_manager.send_notification(
+                channel="emergency",
+                data={
+                    "id": str(row["id"]),
+                    "type": row["emergency_type"],
+                    "priority": row["priority_level"]
+                }
+            )
+            for row in rows
+        ], return_exceptions=True)
+
+        return {
+            "processed": len(rows),
+            "emergencies": [
+                {
+                    "id": str(row["id"]),
+                    "emergency_type": row["emergency_type"],
+                    "priority_level": row["priority_level"]
+                }
+                for row in rows
+            ]
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ Batch emergency processing failed: {e}")
+        await db.rollback()
+        raise HTTPException(status_code=500, detail=f"Batch processing failed: {str(e)}")
+
 @app.get("/emergency/{emergency_id}")
 async def get_emergency_status(
     emergency_id: UUID,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Get the status and details of a specific emergency"""
-    emergency = db.query(Emergency).filter(Emergency.id == emergency_id).first()
+    # Dashboards poll this endpoint while an emergency is ACTIVE; serve
+    # repeat reads from a short-lived cache instead of re-querying
+    cache_key = str(emergency_id)
+    cached = emergency_status_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    emergency = (
+        await db.execute(
+            select(Emergency).where(Emergency.id == emergency_id)
+        )
+    ).scalars().first()
     if not emergency:
         raise HTTPException(status_code=404, detail="Emergency not found")
-    
-    return {
+
+    payload = {
         "id": emergency.id,
         "emergency_type": emergency.emergency_type,
         "priority_level": emergency.priority_level,
@@ -505,12 +756,14 @@ async def get_emergency_status(
         "created_at": emergency.created_at,
         "updated_at": emergency.updated_at
     }
+    emergency_status_cache[cache_key] = payload
+    return payload
 
 @app.put("/emergency/{emergency_id}")
 async def update_emergency(
     emergency_id: str,
     request: dict,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Update the status of an emergency"""
     try:
@@ -520,7 +773,9 @@ async def update_emergency(
         # Convert string to UUID
         from uuid import UUID
         emergency_uuid = UUID(emergency_id)
-        emergency = db.query(Emergency).filter(Emergency.id == emergency_uuid).first()
+        emergency = (
+            await db.execute(select(Emergency).where(Emergency.id == emergency_uuid))
+        ).scalars().first()
         if not emergency:
             logger.error(f"❌ Emergency {emergency_id} not found")
             raise HTTPException(status_code=404, detail="Emergency not found")
@@ -538,22 +793,31 @@ async def update_emergency(
             emergency.actual_response_time = datetime.utcnow()
             logger.info(f"🔄 Set actual_response_time to current time")
         
-        db.commit()
+        await db.commit()
+        _invalidate_emergency_cache(emergency_uuid)
         logger.info(f"✅ Database commit successful")
-        
+
         logger.info(f"Emergency {emergency_id} updated from {old_status} to {emergency.status}")
+
+        # Publish the status change to clients on every worker
+        asyncio.create_task(_publish_emergency({
+            "event": "emergency_update",
+            "id": str(emergency_id),
+            "old_status": old_status,
+            "status": emergency.status
+        }))
         
         return {"message": "Emergency updated successfully", "emergency_id": str(emergency_id)}
         
     except Exception as e:
         logger.error(f"❌ Emergency update failed: {str(e)}")
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=f"Update failed: {str(e)}")
 
 @app.post("/notifications/subscribe")
 async def subscribe_to_notifications(
     notification: NotificationCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Subscribe to notifications"""
     # Simple notification creation instead of subscription
@@ -564,23 +828,34 @@ async def subscribe_to_notifications(
         priority=notification.priority
     )
     db.add(db_notification)
-    db.commit()
+    await db.commit()
     
     return {"message": "Notification created successfully"}
 
 @app.get("/notifications/{subscriber_id}")
 async def get_notifications(
     subscriber_id: str,
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,
+    limit: int = Query(50, le=200),
+    db: AsyncSession = Depends(get_db)
 ):
-    """Get notifications for a subscriber"""
-    notifications = db.query(Notification).filter(
-        Notification.recipient_id == subscriber_id
-    ).order_by(
-        Notification.created_at.desc()
-    ).limit(100).all()
-    
-    return notifications
+    """Get notifications for a subscriber with keyset pagination"""
+    query = (
+        select(Notification)
+        .where(Notification.recipient_id == subscriber_id)
+        .order_by(Notification.created_at.desc(), Notification.id.desc())
+        .limit(limit)
+    )
+    if cursor:
+        ts, last_id = _decode_cursor(cursor)
+        query = query.where(tuple_(Notification.created_at, Notification.id) < (ts, last_id))
+
+    notifications = (await db.execute(query)).scalars().all()
+    next_cursor = (
+        _encode_cursor(notifications[-1].created_at, notifications[-1].id)
+        if len(notifications) == limit else None
+    )
+    return {"items": notifications, "next_cursor": next_cursor}
 
 @app.get("/health")
 async def health_check():
@@ -588,12 +863,14 @@ async def health_check():
     return {"status": "healthy"}
 
 @app.get("/test/update/{emergency_id}")
-async def test_emergency_update(emergency_id: str, db: Session = Depends(get_db)):
+async def test_emergency_update(emergency_id: str, db: AsyncSession = Depends(get_db)):
     """Test emergency update without body parsing"""
     try:
         from uuid import UUID
         emergency_uuid = UUID(emergency_id)
-        emergency = db.query(Emergency).filter(Emergency.id == emergency_uuid).first()
+        emergency = (
+            await db.execute(select(Emergency).where(Emergency.id == emergency_uuid))
+        ).scalars().first()
         if not emergency:
             return {"error": "Emergency not found", "id": emergency_id}
         
@@ -601,19 +878,22 @@ async def test_emergency_update(emergency_id: str, db: Session = Depends(get_db)
         emergency.status = "RESOLVED"
         emergency.notes = "Test update"
         emergency.updated_at = datetime.utcnow()
-        db.commit()
-        
+        await db.commit()
+        _invalidate_emergency_cache(emergency_uuid)
+
         return {"success": True, "emergency_id": emergency_id, "new_status": "RESOLVED"}
     except Exception as e:
         return {"error": str(e), "emergency_id": emergency_id}
 
 @app.get("/emergency/simple-update/{emergency_id}")
-async def simple_update_emergency(emergency_id: str, status: str = "RESOLVED", notes: str = "Closed", db: Session = Depends(get_db)):
+async def simple_update_emergency(emergency_id: str, status: str = "RESOLVED", notes: str = "Closed", db: AsyncSession = Depends(get_db)):
     """Simple emergency update using query parameters"""
     try:
         from uuid import UUID
         emergency_uuid = UUID(emergency_id)
-        emergency = db.query(Emergency).filter(Emergency.id == emergency_uuid).first()
+        emergency = (
+            await db.execute(select(Emergency).where(Emergency.id == emergency_uuid))
+        ).scalars().first()
         if not emergency:
             return {"error": "Emergency not found", "emergency_id": emergency_id}
         
@@ -625,8 +905,9 @@ async def simple_update_emergency(emergency_id: str, status: str = "RESOLVED", n
         if status == "RESOLVED" and emergency.actual_response_time is None:
             emergency.actual_response_time = datetime.utcnow()
         
-        db.commit()
-        
+        await db.commit()
+        _invalidate_emergency_cache(emergency_uuid)
+
         return {
             "success": True,
             "emergency_id": emergency_id,
@@ -635,16 +916,18 @@ async def simple_update_emergency(emergency_id: str, status: str = "RESOLVED", n
             "message": "Emergency updated successfully"
         }
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         return {"error": str(e), "emergency_id": emergency_id}
 
 @app.get("/debug/emergency/{emergency_id}")
-async def debug_emergency(emergency_id: str, db: Session = Depends(get_db)):
+async def debug_emergency(emergency_id: str, db: AsyncSession = Depends(get_db)):
     """Debug endpoint to test database read operations"""
     try:
         from uuid import UUID
         emergency_uuid = UUID(emergency_id)
-        emergency = db.query(Emergency).filter(Emergency.id == emergency_uuid).first()
+        emergency = (
+            await db.execute(select(Emergency).where(Emergency.id == emergency_uuid))
+        ).scalars().first()
         if not emergency:
             return {"error": "Emergency not found", "emergency_id": emergency_id}
         
@@ -660,12 +943,14 @@ async def debug_emergency(emergency_id: str, db: Session = Depends(get_db)):
         return {"error": f"Database error: {str(e)}", "emergency_id": emergency_id}
 
 @app.get("/emergency/{emergency_id}/close")
-async def close_emergency(emergency_id: str, notes: str = "Emergency closed", db: Session = Depends(get_db)):
+async def close_emergency(emergency_id: str, notes: str = "Emergency closed", db: AsyncSession = Depends(get_db)):
     """Close an emergency using GET request as workaround"""
     try:
         from uuid import UUID
         emergency_uuid = UUID(emergency_id)
-        emergency = db.query(Emergency).filter(Emergency.id == emergency_uuid).first()
+        emergency = (
+            await db.execute(select(Emergency).where(Emergency.id == emergency_uuid))
+        ).scalars().first()
         if not emergency:
             raise HTTPException(status_code=404, detail="Emergency not found")
         
@@ -677,8 +962,9 @@ async def close_emergency(emergency_id: str, notes: str = "Emergency closed", db
         if emergency.actual_response_time is None:
             emergency.actual_response_time = datetime.utcnow()
         
-        db.commit()
-        
+        await db.commit()
+        _invalidate_emergency_cache(emergency_uuid)
+
         return {
             "success": True,
             "message": "Emergency closed successfully",
@@ -688,7 +974,7 @@ async def close_emergency(emergency_id: str, notes: str = "Emergency closed", db
         }
         
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to close emergency: {str(e)}")
 
 if __name__ == "__main__":
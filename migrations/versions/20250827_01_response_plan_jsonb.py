@@ -0,0 +1,32 @@
+"""Convert Emergency.response_plan to JSONB with a GIN index
+
+Revision ID: 20250827_01
+Revises:
+Create Date: 2025-08-27
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic
+revision = "20250827_01"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "ALTER TABLE emergencies "
+        "ALTER COLUMN response_plan TYPE jsonb USING response_plan::jsonb"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_emergency_plan_gin "
+        "ON emergencies USING gin (response_plan)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_emergency_plan_gin")
+    op.execute(
+        "ALTER TABLE emergencies "
+        "ALTER COLUMN response_plan TYPE json USING response_plan::json"
+    )
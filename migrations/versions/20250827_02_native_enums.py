@@ -0,0 +1,60 @@
+"""Convert Emergency status/type/priority columns to native Postgres ENUMs
+
+Revision ID: 20250827_02
+Revises: 20250827_01
+Create Date: 2025-08-27
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic
+revision = "20250827_02"
+down_revision = "20250827_01"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "DO $$ BEGIN "
+        "CREATE TYPE emergency_status AS ENUM ('ACTIVE', 'RESOLVED', 'CANCELLED'); "
+        "EXCEPTION WHEN duplicate_object THEN null; END $$"
+    )
+    op.execute(
+        "DO $$ BEGIN "
+        "CREATE TYPE emergency_type AS ENUM ('FIRE', 'MEDICAL', 'POLICE', 'CRIME', "
+        "'TRAFFIC', 'NATURAL_DISASTER', 'OTHER', 'UNKNOWN', 'ERROR'); "
+        "EXCEPTION WHEN duplicate_object THEN null; END $$"
+    )
+    op.execute(
+        "DO $$ BEGIN "
+        "CREATE TYPE priority_level AS ENUM ('HIGH', 'MEDIUM', 'LOW'); "
+        "EXCEPTION WHEN duplicate_object THEN null; END $$"
+    )
+    op.execute(
+        "ALTER TABLE emergencies "
+        "ALTER COLUMN status TYPE emergency_status USING status::emergency_status"
+    )
+    op.execute(
+        "ALTER TABLE emergencies "
+        "ALTER COLUMN emergency_type TYPE emergency_type "
+        "USING emergency_type::emergency_type"
+    )
+    op.execute(
+        "ALTER TABLE emergencies "
+        "ALTER COLUMN priority_level TYPE priority_level "
+        "USING priority_level::priority_level"
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "ALTER TABLE emergencies ALTER COLUMN status TYPE varchar USING status::text"
+    )
+    op.execute(
+        "ALTER TABLE emergencies "
+        "ALTER COLUMN emergency_type TYPE varchar USING emergency_type::text"
+    )
+    op.execute(
+        "ALTER TABLE emergencies "
+        "ALTER COLUMN priority_level TYPE varchar USING priority_level::text"
+    )
@@ -0,0 +1,34 @@
+"""Create the hot-path indexes declared on the Emergency/Notification models
+
+Revision ID: 20250827_03
+Revises: 20250827_02
+Create Date: 2025-08-27
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic
+revision = "20250827_03"
+down_revision = "20250827_02"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_emergency_created_type_status "
+        "ON emergencies (created_at, emergency_type, status)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_emergency_status_active "
+        "ON emergencies (created_at) WHERE status = 'ACTIVE'"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_notif_recipient_created "
+        "ON notifications (recipient_id, created_at)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_notif_recipient_created")
+    op.execute("DROP INDEX IF EXISTS ix_emergency_status_active")
+    op.execute("DROP INDEX IF EXISTS ix_emergency_created_type_status")
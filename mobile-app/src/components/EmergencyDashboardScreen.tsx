@@ -35,7 +35,7 @@ export function EmergencyDashboardScreen({ navigation }: EmergencyDashboardScree
         apiService.getServiceAvailability(),
       ]);
 
-      setEmergencies(emergencyData);
+      setEmergencies(emergencyData.items);
       setStats(statsData);
       setServices(serviceData);
     } catch (error) {
@@ -86,15 +86,15 @@ class ApiService {
     return response.data;
   }
 
-  // Get emergency history
+  // Get emergency history (keyset-paginated: pass next_cursor back as cursor)
   async getEmergencyHistory(params?: {
     start_date?: string;
     end_date?: string;
     emergency_type?: string;
     status?: EmergencyStatus;
     limit?: number;
-    offset?: number;
-  }): Promise<Emergency[]> {
+    cursor?: string;
+  }): Promise<{ items: Emergency[]; next_cursor: string | null }> {
     const response = await this.api.get('/emergency/history', { params });
     return response.data;
   }
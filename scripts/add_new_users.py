@@ -10,7 +10,7 @@ parent_dir = Path(__file__).parent.parent
 sys.path.append(str(parent_dir))
 
 from sqlalchemy.orm import Session
-from database.connection import get_db, init_db
+from database.connection import get_db_sync, init_db
 from database.models import User, UserRole
 from services.auth.auth_utils import get_password_hash
 
@@ -21,7 +21,7 @@ def add_new_users():
     init_db()
     
     # Get database session
-    db = next(get_db())
+    db = next(get_db_sync())
     
     # Define new users to add
     new_users = [
@@ -6,44 +6,44 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.append(str(project_root))
 
-from database.connection import init_db, get_db, engine
+from database.connection import init_db, engine
 from database.models import Base, ServiceAvailability, ServiceStatus, Emergency, EmergencyStatus, PriorityLevel
 from sqlalchemy import text
+from sqlalchemy.orm import Session
 
-def create_enum_types():
-    """Create enum types in the database"""
-    with engine.connect() as conn:
-        # Create EmergencyStatus enum
-        conn.execute(text("""
-            DO $$ BEGIN
-                CREATE TYPE emergency_status AS ENUM ('ACTIVE', 'RESOLVED', 'CANCELLED');
-            EXCEPTION
-                WHEN duplicate_object THEN null;
-            END $$;
-        """))
-        
-        # Create PriorityLevel enum
-        conn.execute(text("""
-            DO $$ BEGIN
-                CREATE TYPE priority_level AS ENUM ('HIGH', 'MEDIUM', 'LOW');
-            EXCEPTION
-                WHEN duplicate_object THEN null;
-            END $$;
-        """))
-        
-        conn.commit()
+def create_enum_types(conn):
+    """Create enum types on an open database connection"""
+    # Create EmergencyStatus enum
+    conn.execute(text("""
+        DO $$ BEGIN
+            CREATE TYPE emergency_status AS ENUM ('ACTIVE', 'RESOLVED', 'CANCELLED');
+        EXCEPTION
+            WHEN duplicate_object THEN null;
+        END $$;
+    """))
+
+    # Create EmergencyType enum
+    conn.execute(text("""
+        DO $$ BEGIN
+            CREATE TYPE emergency_type AS ENUM ('FIRE', 'MEDICAL', 'POLICE', 'CRIME', 'TRAFFIC', 'NATURAL_DISASTER', 'OTHER', 'UNKNOWN', 'ERROR');
+        EXCEPTION
+            WHEN duplicate_object THEN null;
+        END $$;
+    """))
+
+    # Create PriorityLevel enum
+    conn.execute(text("""
+        DO $$ BEGIN
+            CREATE TYPE priority_level AS ENUM ('HIGH', 'MEDIUM', 'LOW');
+        EXCEPTION
+            WHEN duplicate_object THEN null;
+        END $$;
+    """))
 
 def initialize_database():
     """Initialize database and create initial records"""
     print("Initializing database...")
-    
-    # Create enum types
-    create_enum_types()
-    
-    # Create tables
-    Base.metadata.create_all(bind=engine)
-    print("Tables created successfully")
-    
+
     # Create initial service records
     initial_services = [
         {
@@ -71,16 +71,22 @@ def initialize_database():
             "average_response_time": 15
         }
     ]
-    
-    with get_db() as db:
+
+    # Enum types, schema, and seed data commit atomically: either the
+    # database comes up fully initialized or not at all
+    with engine.begin() as conn:
+        create_enum_types(conn)
+        Base.metadata.create_all(bind=conn)
+        print("Tables created successfully")
+
+        db = Session(bind=conn)
         # Check if services already exist
-        existing_services = db.query(ServiceAvailability).all()
+        existing_services = db.query(ServiceAvailability).first()
         if not existing_services:
             print("Creating initial service records...")
-            for service_data in initial_services:
-                service = ServiceAvailability(**service_data)
-                db.add(service)
-            db.commit()
+            # Single multi-row INSERT instead of one round-trip per record
+            db.bulk_insert_mappings(ServiceAvailability, initial_services)
+            db.flush()
             print("Initial service records created successfully")
         else:
             print("Service records already exist")
@@ -88,13 +94,14 @@ def initialize_database():
 def main():
     """Initialize the database"""
     print("Initializing database...")
-    
-    # Create enum types
-    create_enum_types()
-    
-    # Create tables
-    Base.metadata.create_all(bind=engine)
+
+    with engine.begin() as conn:
+        # Create enum types
+        create_enum_types(conn)
+
+        # Create tables
+        Base.metadata.create_all(bind=conn)
     print("Tables created successfully")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
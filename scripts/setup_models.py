@@ -24,8 +24,50 @@ def setup_models():
         num_labels=4  # Fire, Medical, Police, NGO
     )
     model.save_pretrained(models_dir)
-    
+
+    # Export an INT8 ONNX copy so the classifier can serve through
+    # ONNX Runtime's fused BERT kernels instead of eager PyTorch
+    export_onnx(models_dir, model, tokenizer)
+
     print("Models setup complete!")
 
+def export_onnx(models_dir: Path, model, tokenizer):
+    """Export the classifier to ONNX and write an INT8-quantized copy"""
+    try:
+        import torch
+        from onnxruntime.quantization import quantize_dynamic, QuantType
+    except ImportError as e:
+        print(f"Skipping ONNX export (onnxruntime not installed): {e}")
+        return
+
+    print("Exporting ONNX model...")
+    model.eval()
+    sample = tokenizer(
+        "warmup", return_tensors="pt", padding="max_length",
+        truncation=True, max_length=128
+    )
+    onnx_path = models_dir / "clf.onnx"
+    torch.onnx.export(
+        model,
+        (sample["input_ids"], sample["attention_mask"]),
+        str(onnx_path),
+        opset_version=17,
+        input_names=["input_ids", "attention_mask"],
+        output_names=["logits"],
+        dynamic_axes={
+            "input_ids": {0: "batch", 1: "sequence"},
+            "attention_mask": {0: "batch", 1: "sequence"},
+            "logits": {0: "batch"}
+        }
+    )
+
+    # Dynamic INT8 quantization of the exported graph's weights
+    quantize_dynamic(
+        str(onnx_path),
+        str(models_dir / "clf.int8.onnx"),
+        weight_type=QuantType.QInt8
+    )
+    print("ONNX export complete: clf.int8.onnx")
+
 if __name__ == "__main__":
     setup_models() 
\ No newline at end of file
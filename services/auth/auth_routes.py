@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy import select, func, or_
+from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel, EmailStr
 from typing import Optional, Dict, Any
 from database.connection import get_db
@@ -42,14 +43,14 @@ class UserResponse(BaseModel):
 @router.post("/login", response_model=LoginResponse)
 async def login(
     login_data: LoginRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Authenticate user and return access token"""
     # Clean up expired sessions first
-    cleanup_expired_sessions(db)
+    await cleanup_expired_sessions(db)
     
     # Authenticate user
-    user = authenticate_user(db, login_data.username, login_data.password)
+    user = await authenticate_user(db, login_data.username, login_data.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -66,7 +67,7 @@ async def login(
     access_token = create_access_token(data=access_token_data)
     
     # Create user session
-    create_user_session(db, user, access_token)
+    await create_user_session(db, user, access_token)
     
     return LoginResponse(
         access_token=access_token,
@@ -76,11 +77,11 @@ async def login(
 @router.post("/logout")
 async def logout(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Logout user and invalidate session"""
     token = credentials.credentials
-    success = invalidate_user_session(db, token)
+    success = await invalidate_user_session(db, token)
     
     if success:
         return {"message": "Successfully logged out"}
@@ -113,16 +114,22 @@ async def verify_token(
 @router.post("/create-user", response_model=UserResponse)
 async def create_user(
     user_data: CreateUserRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(require_admin)
 ):
     """Create a new user (admin only)"""
     
     # Check if username or email already exists
-    existing_user = db.query(User).filter(
-        (User.username == user_data.username) | 
-        (User.email == user_data.email)
-    ).first()
+    existing_user = (
+        await db.execute(
+            select(User).where(
+                or_(
+                    User.username == user_data.username,
+                    User.email == user_data.email
+                )
+            )
+        )
+    ).scalars().first()
     
     if existing_user:
         raise HTTPException(
@@ -132,7 +139,9 @@ async def create_user(
     
     # Check if badge number already exists (if provided)
     if user_data.badge_number:
-        existing_badge = db.query(User).filter(User.badge_number == user_data.badge_number).first()
+        existing_badge = (
+            await db.execute(select(User).where(User.badge_number == user_data.badge_number))
+        ).scalars().first()
         if existing_badge:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -151,33 +160,38 @@ async def create_user(
     )
     
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    await db.commit()
+    await db.refresh(new_user)
     
     return UserResponse(user=get_user_dict(new_user))
 
 @router.get("/users")
 async def list_users(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(require_admin),
     skip: int = 0,
     limit: int = 50
 ):
     """List all users (admin only)"""
-    users = db.query(User).offset(skip).limit(limit).all()
+    users = (
+        await db.execute(select(User).offset(skip).limit(limit))
+    ).scalars().all()
+    total = (await db.execute(select(func.count()).select_from(User))).scalar_one()
     return {
         "users": [get_user_dict(user) for user in users],
-        "total": db.query(User).count()
+        "total": total
     }
 
 @router.put("/users/{user_id}/toggle-active")
 async def toggle_user_active(
     user_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(require_admin)
 ):
     """Toggle user active status (admin only)"""
-    user = db.query(User).filter(User.id == user_id).first()
+    user = (
+        await db.execute(select(User).where(User.id == user_id))
+    ).scalars().first()
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -185,7 +199,7 @@ async def toggle_user_active(
         )
     
     user.is_active = not user.is_active
-    db.commit()
+    await db.commit()
     
     return {
         "message": f"User {'activated' if user.is_active else 'deactivated'} successfully",
@@ -194,9 +208,9 @@ async def toggle_user_active(
 
 @router.delete("/cleanup-sessions")
 async def cleanup_expired_sessions_endpoint(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(require_admin)
 ):
     """Clean up expired sessions (admin only)"""
-    count = cleanup_expired_sessions(db)
+    count = await cleanup_expired_sessions(db)
     return {"message": f"Cleaned up {count} expired sessions"} 
\ No newline at end of file
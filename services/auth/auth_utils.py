@@ -4,7 +4,9 @@ from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 from passlib.context import CryptContext
 from jose import jwt, JWTError
-from sqlalchemy.orm import Session
+from sqlalchemy import select, delete
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from database.models import User, UserSession, UserRole
 
 # Password hashing
@@ -43,9 +45,11 @@ def verify_token(token: str) -> Optional[Dict[str, Any]]:
     except JWTError:
         return None
 
-def authenticate_user(db: Session, username: str, password: str) -> Optional[User]:
+async def authenticate_user(db: AsyncSession, username: str, password: str) -> Optional[User]:
     """Authenticate a user with username and password"""
-    user = db.query(User).filter(User.username == username).first()
+    user = (
+        await db.execute(select(User).where(User.username == username))
+    ).scalars().first()
     if not user:
         return None
     if not verify_password(password, user.hashed_password):
@@ -54,7 +58,7 @@ def authenticate_user(db: Session, username: str, password: str) -> Optional[Use
         return None
     return user
 
-def create_user_session(db: Session, user: User, token: str) -> UserSession:
+async def create_user_session(db: AsyncSession, user: User, token: str) -> UserSession:
     """Create a new user session"""
     expires_at = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     
@@ -65,50 +69,57 @@ def create_user_session(db: Session, user: User, token: str) -> UserSession:
     )
     
     db.add(session)
-    db.commit()
-    db.refresh(session)
     
     # Update user's last login
     user.last_login = datetime.utcnow()
-    db.commit()
+    await db.commit()
+    await db.refresh(session)
     
     return session
 
-def verify_user_session(db: Session, token: str) -> Optional[User]:
+async def verify_user_session(db: AsyncSession, token: str) -> Optional[User]:
     """Verify a user session token"""
-    session = db.query(UserSession).filter(UserSession.token == token).first()
+    session = (
+        await db.execute(
+            select(UserSession)
+            .options(selectinload(UserSession.user))
+            .where(UserSession.token == token)
+        )
+    ).scalars().first()
     
     if not session:
         return None
     
     if session.expires_at < datetime.utcnow():
         # Session expired, delete it
-        db.delete(session)
-        db.commit()
+        await db.delete(session)
+        await db.commit()
         return None
     
     # Update last used time
     session.last_used = datetime.utcnow()
-    db.commit()
+    await db.commit()
     
     return session.user
 
-def invalidate_user_session(db: Session, token: str) -> bool:
+async def invalidate_user_session(db: AsyncSession, token: str) -> bool:
     """Invalidate a user session (logout)"""
-    session = db.query(UserSession).filter(UserSession.token == token).first()
+    session = (
+        await db.execute(select(UserSession).where(UserSession.token == token))
+    ).scalars().first()
     if session:
-        db.delete(session)
-        db.commit()
+        await db.delete(session)
+        await db.commit()
         return True
     return False
 
-def cleanup_expired_sessions(db: Session) -> int:
+async def cleanup_expired_sessions(db: AsyncSession) -> int:
     """Clean up expired sessions and return count of cleaned sessions"""
-    expired_count = db.query(UserSession).filter(
-        UserSession.expires_at < datetime.utcnow()
-    ).delete()
-    db.commit()
-    return expired_count
+    result = await db.execute(
+        delete(UserSession).where(UserSession.expires_at < datetime.utcnow())
+    )
+    await db.commit()
+    return result.rowcount
 
 def user_has_permission(user: User, required_role: UserRole) -> bool:
     """Check if user has required role permission"""
@@ -1,7 +1,7 @@
 from typing import Optional
 from fastapi import HTTPException, status, Depends, Header
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from database.connection import get_db
 from database.models import User, UserRole
 from .auth_utils import verify_token, verify_user_session
@@ -11,7 +11,7 @@ security = HTTPBearer()
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> User:
     """Get current authenticated user"""
     credentials_exception = HTTPException(
@@ -23,7 +23,7 @@ async def get_current_user(
     try:
         token = credentials.credentials
         # Verify session token
-        user = verify_user_session(db, token)
+        user = await verify_user_session(db, token)
         if user is None:
             raise credentials_exception
         return user
@@ -38,7 +38,7 @@ async def get_current_active_user(current_user: User = Depends(get_current_user)
 
 async def get_optional_user(
     authorization: Optional[str] = Header(None),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> Optional[User]:
     """Get current user if token is provided, otherwise return None"""
     if not authorization:
@@ -50,7 +50,7 @@ async def get_optional_user(
             return None
         
         token = authorization.split(" ")[1]
-        user = verify_user_session(db, token)
+        user = await verify_user_session(db, token)
         return user if user and user.is_active else None
     except Exception:
         return None
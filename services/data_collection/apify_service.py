@@ -1,12 +1,28 @@
 from apify_client import ApifyClient
 from typing import Dict, List, Optional
+from dataclasses import dataclass
 import asyncio
-import json
-from redis import Redis
+import orjson
+from redis.asyncio import Redis as AsyncRedis
 from datetime import datetime
 import os
 import random
 
+@dataclass(slots=True, frozen=True)
+class Hospital:
+    """One nearby-hospital row
+
+    Slots skip the per-instance __dict__, so building 50 of these per
+    request allocates far less than 50 six-key dicts; orjson serializes
+    dataclasses natively so caching and responses are unchanged.
+    """
+    name: Optional[str]
+    address: Optional[str]
+    phone: Optional[str]
+    rating: Optional[float]
+    distance: Optional[float]
+    emergency: bool
+
 class ApifyDataCollector:
     def __init__(self, api_token: str):
         """
@@ -16,8 +32,18 @@ class ApifyDataCollector:
             api_token: Apify API token
         """
         self.client = ApifyClient(api_token)
-        self.cache = Redis.from_url(os.getenv("REDIS_URL", "redis://localhost:6379"))
+        # Async client: the cache helpers await get/set, and non-blocking
+        # sockets keep the event loop free during Redis round-trips. The
+        # pool bound stops bursty gathers from stalling on socket creation.
+        self.cache = AsyncRedis.from_url(
+            os.getenv("REDIS_URL", "redis://localhost:6379"),
+            max_connections=32
+        )
         
+        # In-flight fetches keyed by cache key, so concurrent misses for the
+        # same location share one actor run instead of stampeding Apify
+        self._inflight: Dict[str, asyncio.Future] = {}
+
         # Cache TTLs in seconds
         self.cache_ttls = {
             "hospitals": 3600,  # 1 hour
@@ -26,6 +52,34 @@ class ApifyDataCollector:
             "services": 1800    # 30 minutes
         }
 
+    async def _singleflight(self, cache_key: str, fetch):
+        """Run fetch() once per cache key; concurrent callers share the result"""
+        existing = self._inflight.get(cache_key)
+        if existing is not None:
+            return await existing
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
+        try:
+            result = await fetch()
+            future.set_result(result)
+            return result
+        except Exception as e:
+            future.set_exception(e)
+            # Consume the exception in case no one else is waiting on it
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(cache_key, None)
+
+    def _geo_key(self, location: Dict[str, float], precision: int = 3) -> str:
+        """Build a cache-key fragment from quantized coordinates
+
+        Full-precision floats make requests metres apart miss the cache;
+        3 decimals snap to a ~110 m grid (2 decimals ~1.1 km for weather).
+        """
+        return f"{round(location['lat'], precision)}:{round(location['lon'], precision)}"
+
     async def get_emergency_context(
         self,
         location: Dict[str, float],
@@ -64,17 +118,19 @@ class ApifyDataCollector:
     async def _get_weather_data(self, location: Dict[str, float]) -> Dict:
         """Get weather data for location"""
         try:
-            # Use a real weather actor (OpenWeatherMap scraper)
-            run = self.client.actor("lukaskrivka/openweathermap-scraper").call(
+            # ApifyClient is synchronous; run the blocking HTTP call on the
+            # thread pool so gathered fetches actually overlap
+            run = await asyncio.to_thread(
+                self.client.actor("lukaskrivka/openweathermap-scraper").call,
                 run_input={
                     "lat": location["lat"],
                     "lon": location["lon"],
                     "units": "metric"
                 }
             )
-            
+
             # Get the results
-            items = list(run.iterate_items())
+            items = await asyncio.to_thread(lambda: list(run.iterate_items()))
             if items:
                 data = items[0]
                 return {
@@ -180,7 +236,8 @@ class ApifyDataCollector:
     async def _get_hospitals(self, location: Dict[str, float]) -> list:
         """Get nearby hospitals"""
         try:
-            run = self.client.actor("apify/hospitals").call(
+            run = await asyncio.to_thread(
+                self.client.actor("apify/hospitals").call,
                 run_input={
                     "lat": location["lat"],
                     "lon": location["lon"],
@@ -218,7 +275,8 @@ class ApifyDataCollector:
     async def _get_police_stations(self, location: Dict[str, float]) -> list:
         """Get nearby police stations"""
         try:
-            run = self.client.actor("apify/police-stations").call(
+            run = await asyncio.to_thread(
+                self.client.actor("apify/police-stations").call,
                 run_input={
                     "lat": location["lat"],
                     "lon": location["lon"],
@@ -233,114 +291,137 @@ class ApifyDataCollector:
 
     async def get_nearby_hospitals(self, location: Dict[str, float]) -> Dict:
         """Get nearby hospitals using Apify actor"""
-        cache_key = f"hospitals:{location['lat']}:{location['lon']}"
+        cache_key = f"hospitals:{self._geo_key(location)}"
         
-        # Check cache
+        # Check cache; rows round-trip through orjson as dicts, so rebuild
+        # Hospital instances to match what the fetch path returns
         if cached := await self._get_from_cache(cache_key):
-            return {"hospitals": cached}
+            return {"hospitals": [Hospital(**row) for row in cached]}
         
         try:
-            run_input = {
-                "startUrls": [{
-                    "url": f"https://maps.google.com/search/hospitals/@{location['lat']},{location['lon']}"
-                }],
-                "radius": "10km"
-            }
-            
-            # Run Apify actor
-            run = await self.client.actor("apify/google-places-scraper").call(
-                run_input=run_input
-            )
-            
-            # Get results
-            items = await self.client.dataset(run["defaultDatasetId"]).list_items().items()
-            
-            # Process and cache results
-            hospitals = self._process_hospital_data(items)
-            await self._set_in_cache(cache_key, hospitals, "hospitals")
-            
-            return {"hospitals": hospitals}
-            
+            async def fetch():
+                run_input = {
+                    "startUrls": [{
+                        "url": f"https://maps.google.com/search/hospitals/@{location['lat']},{location['lon']}"
+                    }],
+                    "radius": "10km"
+                }
+
+                # Run Apify actor on the thread pool (the client is sync-blocking)
+                run = await asyncio.to_thread(
+                    self.client.actor("apify/google-places-scraper").call,
+                    run_input=run_input
+                )
+
+                # Get results
+                items = await asyncio.to_thread(
+                    lambda: self.client.dataset(run["defaultDatasetId"]).list_items().items
+                )
+
+                # Process and cache results
+                hospitals = self._process_hospital_data(items)
+                await self._set_in_cache(cache_key, hospitals, "hospitals")
+                return hospitals
+
+            return {"hospitals": await self._singleflight(cache_key, fetch)}
+
+
         except Exception as e:
             print(f"Error fetching hospital data: {str(e)}")
             return {"hospitals": []}
 
     async def get_traffic_conditions(self, location: Dict[str, float]) -> Dict:
         """Get traffic conditions using Apify actor"""
-        cache_key = f"traffic:{location['lat']}:{location['lon']}"
+        cache_key = f"traffic:{self._geo_key(location)}"
         
         if cached := await self._get_from_cache(cache_key):
             return {"traffic": cached}
             
         try:
-            run_input = {
-                "location": f"{location['lat']},{location['lon']}",
-                "radius": 5000  # 5km radius
-            }
-            
-            run = await self.client.actor("apify/google-maps-traffic").call(
-                run_input=run_input
-            )
-            
-            items = await self.client.dataset(run["defaultDatasetId"]).list_items().items()
-            
-            traffic_data = self._process_traffic_data(items)
-            await self._set_in_cache(cache_key, traffic_data, "traffic")
-            
-            return {"traffic": traffic_data}
-            
+            async def fetch():
+                run_input = {
+                    "location": f"{location['lat']},{location['lon']}",
+                    "radius": 5000  # 5km radius
+                }
+
+                run = await asyncio.to_thread(
+                    self.client.actor("apify/google-maps-traffic").call,
+                    run_input=run_input
+                )
+
+                items = await asyncio.to_thread(
+                    lambda: self.client.dataset(run["defaultDatasetId"]).list_items().items
+                )
+
+                traffic_data = self._process_traffic_data(items)
+                await self._set_in_cache(cache_key, traffic_data, "traffic")
+                return traffic_data
+
+            return {"traffic": await self._singleflight(cache_key, fetch)}
+
+
         except Exception as e:
             print(f"Error fetching traffic data: {str(e)}")
             return {"traffic": {"status": "unknown"}}
 
     async def get_weather_data(self, location: Dict[str, float]) -> Dict:
         """Get weather data using Apify actor"""
-        cache_key = f"weather:{location['lat']}:{location['lon']}"
+        cache_key = f"weather:{self._geo_key(location, precision=2)}"
         
         if cached := await self._get_from_cache(cache_key):
             return {"weather": cached}
             
         try:
-            run = await self.client.actor("apify/weather-checker").call(
-                run_input={"locations": [f"{location['lat']},{location['lon']}"]}
-            )
-            
-            items = await self.client.dataset(run["defaultDatasetId"]).list_items().items()
-            
-            weather_data = self._process_weather_data(items)
-            await self._set_in_cache(cache_key, weather_data, "weather")
-            
-            return {"weather": weather_data}
-            
+            async def fetch():
+                run = await asyncio.to_thread(
+                    self.client.actor("apify/weather-checker").call,
+                    run_input={"locations": [f"{location['lat']},{location['lon']}"]}
+                )
+
+                items = await asyncio.to_thread(
+                    lambda: self.client.dataset(run["defaultDatasetId"]).list_items().items
+                )
+
+                weather_data = self._process_weather_data(items)
+                await self._set_in_cache(cache_key, weather_data, "weather")
+                return weather_data
+
+            return {"weather": await self._singleflight(cache_key, fetch)}
+
+
         except Exception as e:
             print(f"Error fetching weather data: {str(e)}")
             return {"weather": {"status": "unknown"}}
 
-    def _process_hospital_data(self, items: List[Dict]) -> List[Dict]:
+    # Hospital fields copied verbatim from the raw items, hoisted so the
+    # per-item loop does one map instead of six method lookups
+    _HOSPITAL_FIELDS = ("name", "address", "phone", "rating", "distance")
+
+    def _process_hospital_data(self, items: List[Dict]) -> List[Hospital]:
         """Process and format hospital data"""
-        return [{
-            "name": item.get("name"),
-            "address": item.get("address"),
-            "phone": item.get("phone"),
-            "rating": item.get("rating"),
-            "distance": item.get("distance"),
-            "emergency": item.get("emergency", False)
-        } for item in items]
+        fields = self._HOSPITAL_FIELDS
+        return [
+            Hospital(*map(item.get, fields), item.get("emergency", False))
+            for item in items
+        ]
 
     def _process_traffic_data(self, items: List[Dict]) -> Dict:
         """Process and format traffic data"""
+        # Index the single payload item once; second-granularity utcnow
+        # skips the timezone machinery and sub-second formatting
+        data = items[0]
         return {
-            "congestion_level": items[0].get("congestionLevel", "unknown"),
-            "incidents": items[0].get("incidents", []),
-            "average_speed": items[0].get("averageSpeed"),
-            "timestamp": datetime.now().isoformat()
+            "congestion_level": data.get("congestionLevel", "unknown"),
+            "incidents": data.get("incidents", []),
+            "average_speed": data.get("averageSpeed"),
+            "timestamp": datetime.utcnow().isoformat(timespec="seconds")
         }
 
     def _process_weather_data(self, items: List[Dict]) -> Dict:
         """Process and format weather data"""
         if not items:
             return {"status": "unknown"}
-            
+
         weather = items[0]
         return {
             "temperature": weather.get("temperature"),
@@ -348,14 +429,14 @@ class ApifyDataCollector:
             "visibility": weather.get("visibility"),
             "wind_speed": weather.get("windSpeed"),
             "precipitation": weather.get("precipitation"),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": datetime.utcnow().isoformat(timespec="seconds")
         }
 
     async def _get_from_cache(self, key: str) -> Optional[Dict]:
         """Get data from Redis cache"""
         try:
             data = await self.cache.get(key)
-            return json.loads(data) if data else None
+            return orjson.loads(data) if data else None
         except Exception:
             return None
 
@@ -364,7 +445,7 @@ class ApifyDataCollector:
         try:
             await self.cache.set(
                 key,
-                json.dumps(data),
+                orjson.dumps(data),
                 ex=self.cache_ttls.get(data_type, 3600)
             )
         except Exception as e:
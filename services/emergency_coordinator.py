@@ -1,8 +1,7 @@
 from typing import Dict, List, Optional, Any
-from services.classification.emergency_classifier import EmergencyClassifier
-from services.translation.translation_service import TranslationService
-from services.speech.speech_service import SpeechService
-from services.data_collection.apify_service import ApifyDataCollector
+from collections import OrderedDict
+from functools import cached_property
+from hashlib import blake2b
 from services.notification.notification_service import notification_manager
 import os
 import asyncio
@@ -12,12 +11,55 @@ from dotenv import load_dotenv
 load_dotenv()
 
 class EmergencyCoordinator:
-    def __init__(self):
-        """Initialize the emergency coordinator with required services"""
-        self.translation_service = TranslationService()
-        self.emergency_classifier = EmergencyClassifier()
-        self.speech_service = SpeechService(test_mode=False)
-        self.data_collector = ApifyDataCollector(api_token=os.getenv("APIFY_API_TOKEN", ""))
+    def __init__(self, max_batch_size: int = 8, max_wait_ms: float = 10.0):
+        """Initialize the emergency coordinator with required services
+
+        Args:
+            max_batch_size: Most concurrent reports coalesced per pipeline pass
+            max_wait_ms: Longest a report waits for batch-mates before running
+        """
+        # Text-pipeline micro-batcher: concurrent reports share one
+        # detect/translate API call per batch instead of one per report.
+        # Started lazily since no event loop runs at import time.
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self._pipeline_queue = None
+        self._pipeline_task = None
+
+        # LRU of text-hash -> detected language; repeated phrases (retries,
+        # re-submitted reports) skip the detection API entirely
+        self._lang_cache = OrderedDict()
+
+    _LANG_CACHE_MAXSIZE = 4096
+
+    @staticmethod
+    def _text_key(text: str) -> bytes:
+        """Fast fixed-size hash used as the language-cache key"""
+        return blake2b(text.encode(), digest_size=16).digest()
+
+    # Services are constructed on first use rather than at import time, so
+    # workers that never touch a given input path (e.g. audio) never pay its
+    # model load or the resident memory
+
+    @cached_property
+    def translation_service(self):
+        from services.translation.translation_service import TranslationService
+        return TranslationService()
+
+    @cached_property
+    def emergency_classifier(self):
+        from services.classification.emergency_classifier import EmergencyClassifier
+        return EmergencyClassifier()
+
+    @cached_property
+    def speech_service(self):
+        from services.speech.speech_service import SpeechService
+        return SpeechService(test_mode=False)
+
+    @cached_property
+    def data_collector(self):
+        from services.data_collection.apify_service import ApifyDataCollector
+        return ApifyDataCollector(api_token=os.getenv("APIFY_API_TOKEN", ""))
 
     async def process_emergency(
         self,
@@ -45,17 +87,12 @@ class EmergencyCoordinator:
             if not text:
                 raise Exception("No text input provided")
 
-            # Detect language and translate if needed
-            lang_result = await self.translation_service.detect_language(text)
-            if self.translation_service.is_translation_needed(lang_result["language"]):
-                translation = await self.translation_service.translate(text)
-                text = translation["translated_text"]
-
-            # Classify emergency
-            classification = await self.emergency_classifier.classify(text)
+            # Detect language, translate if needed, and classify, sharing
+            # batched pipeline passes with other in-flight reports
+            text, classification = await self._run_text_pipeline(text)
 
             # Get required services
-            required_services = await self.emergency_classifier.get_required_services(
+            required_services = self.emergency_classifier.get_required_services(
                 classification["type"],
                 classification["confidence"]
             )
@@ -83,6 +120,94 @@ class EmergencyCoordinator:
         except Exception as e:
             raise Exception(f"Failed to process emergency: {str(e)}")
 
+    async def _run_text_pipeline(self, text: str):
+        """Queue a text for the batched detect/translate/classify pipeline"""
+        self._ensure_pipeline_worker()
+        future = asyncio.get_running_loop().create_future()
+        await self._pipeline_queue.put((text, future))
+        return await future
+
+    def _ensure_pipeline_worker(self):
+        """Start the pipeline worker on the running loop if needed"""
+        if self._pipeline_task is None or self._pipeline_task.done():
+            self._pipeline_queue = asyncio.Queue()
+            self._pipeline_task = asyncio.create_task(self._pipeline_worker())
+
+    async def _pipeline_worker(self):
+        """Drain queued reports and run each pipeline stage once per batch"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._pipeline_queue.get()]
+            deadline = loop.time() + self.max_wait_ms / 1000.0
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._pipeline_queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            texts = [text for text, _ in batch]
+            try:
+                results = await self._run_pipeline_batch(texts)
+                for (_, future), result in zip(batch, results):
+                    if not future.done():
+                        future.set_result(result)
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+
+    async def _run_pipeline_batch(self, texts: List[str]) -> List[tuple]:
+        """Detect, translate, and classify a batch of texts
+
+        One detect call and (at most) one translate call cover the whole
+        batch; classification runs through the classifier's own batcher.
+        """
+        # Resolve languages from the LRU first; only misses hit the API
+        keys = [self._text_key(text) for text in texts]
+        languages = [None] * len(texts)
+        misses = []
+        for i, key in enumerate(keys):
+            cached = self._lang_cache.get(key)
+            if cached is not None:
+                self._lang_cache.move_to_end(key)
+                languages[i] = cached
+            else:
+                misses.append(i)
+
+        if misses:
+            detected = await self.translation_service.detect_language_batch(
+                [texts[i] for i in misses]
+            )
+            for i, result in zip(misses, detected):
+                languages[i] = result["language"]
+                self._lang_cache[keys[i]] = result["language"]
+                if len(self._lang_cache) > self._LANG_CACHE_MAXSIZE:
+                    self._lang_cache.popitem(last=False)
+
+        needs_translation = [
+            self.translation_service.is_translation_needed(language)
+            for language in languages
+        ]
+
+        final_texts = list(texts)
+        to_translate = [text for text, needed in zip(texts, needs_translation) if needed]
+        if to_translate:
+            translations = iter(
+                await self.translation_service.translate_batch(to_translate)
+            )
+            final_texts = [
+                next(translations)["translated_text"] if needed else text
+                for text, needed in zip(texts, needs_translation)
+            ]
+
+        classifications = await asyncio.gather(
+            *[self.emergency_classifier.classify(text) for text in final_texts]
+        )
+        return list(zip(final_texts, classifications))
+
     def _determine_priority(
         self,
         classification: Dict[str, Any],
@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, BinaryIO, Union
 from datetime import datetime
 import asyncio
 import logging
@@ -62,7 +62,7 @@ class EnhancedEmergencyCoordinator:
     async def process_emergency(
         self,
         text: Optional[str] = None,
-        audio: Optional[bytes] = None,
+        audio: Optional[Union[bytes, BinaryIO]] = None,
         location: Optional[Dict[str, float]] = None,
         session_id: Optional[str] = None
     ) -> Dict[str, Any]:
@@ -71,7 +71,7 @@ class EnhancedEmergencyCoordinator:
         
         Args:
             text: Text input (optional)
-            audio: Audio input in bytes (optional)
+            audio: Audio input as bytes or a file-like object (optional)
             location: Dictionary containing lat and lon (optional)
             session_id: Session identifier (optional)
             
@@ -108,8 +108,9 @@ class EnhancedEmergencyCoordinator:
                 mcp_response, location_context
             )
             
-            # Step 8: Send notifications
-            await self._send_enhanced_notifications(enhanced_response)
+            # Step 8: Send notifications off the request path; the response
+            # should not wait on the notification fan-out
+            asyncio.create_task(self._send_enhanced_notifications(enhanced_response))
             
             # Step 9: Build final response
             final_response = self._build_final_response(
@@ -123,7 +124,7 @@ class EnhancedEmergencyCoordinator:
             logger.error(f"Enhanced emergency processing failed: {e}")
             return self._create_error_response(str(e))
     
-    async def _process_audio_input(self, audio: Optional[bytes], text: Optional[str]) -> str:
+    async def _process_audio_input(self, audio: Optional[Union[bytes, BinaryIO]], text: Optional[str]) -> str:
         """Process audio input to text"""
         if audio and not text:
             transcription_result = await self.speech_service.transcribe(audio)
@@ -135,10 +136,11 @@ class EnhancedEmergencyCoordinator:
         if not text:
             raise Exception("No text input provided")
         
-        lang_result = await self.translation_service.detect_language(text)
-        if self.translation_service.is_translation_needed(lang_result["language"]):
-            translation = await self.translation_service.translate(text)
-            return translation["translated_text"]
+        # One fused RPC returns both the detected language and the
+        # translation, instead of a detect call followed by a translate call
+        result = await self.translation_service.detect_and_translate(text)
+        if self.translation_service.is_translation_needed(result["detected_language"]):
+            return result["translated_text"]
         return text
     
     async def _classify_emergency(self, text: str) -> Dict[str, Any]:
@@ -9,6 +9,47 @@ from apify_client import ApifyClient
 
 logger = logging.getLogger(__name__)
 
+# Keyword tables built once at import time; _determine_capabilities and
+# _extract_specialties run per facility and should not rebuild them
+_CAPABILITIES_MAP = {
+    "hospitals": {
+        "emergency_department": ["emergency", "er", "trauma"],
+        "intensive_care": ["icu", "intensive", "critical care"],
+        "cardiac_care": ["cardiac", "heart", "cardiology"],
+        "trauma_center": ["trauma", "level 1", "level i"],
+        "stroke_center": ["stroke", "neurology"],
+        "maternity": ["maternity", "obstetrics", "birth"]
+    },
+    "fire_stations": {
+        "structure_fire": ["structure", "building"],
+        "wildfire": ["wildfire", "forest", "brush"],
+        "hazmat": ["hazmat", "hazardous", "chemical"],
+        "rescue": ["rescue", "technical rescue"],
+        "medical": ["ems", "ambulance", "medical"]
+    },
+    "police_stations": {
+        "patrol": ["patrol", "response"],
+        "detective": ["detective", "investigation"],
+        "swat": ["swat", "tactical", "special"],
+        "traffic": ["traffic", "highway"]
+    }
+}
+
+_DEFAULT_CAPABILITIES = {
+    "hospitals": ["emergency_department"],
+    "fire_stations": ["structure_fire", "medical"],
+    "police_stations": ["patrol"]
+}
+
+_SPECIALTY_KEYWORDS = {
+    "cardiology": ["cardiology", "heart", "cardiac"],
+    "neurology": ["neurology", "brain", "stroke", "neuro"],
+    "trauma_surgery": ["trauma", "surgery", "surgical"],
+    "pediatrics": ["pediatric", "children", "kids"],
+    "emergency_medicine": ["emergency", "er", "trauma"],
+    "orthopedics": ["orthopedic", "bone", "joint"]
+}
+
 @dataclass
 class EmergencyFacility:
     """Structured emergency facility data"""
@@ -192,8 +233,11 @@ class LocationIntelligence:
             name = item.get("title", "Unknown Facility")
             address = item.get("address", "Address not available")
             
+            # Lowercase the description once; both helpers scan the same text
+            description = (item.get("description", "") + " " + item.get("title", "")).lower()
+
             # Determine capabilities based on facility type and description
-            capabilities = self._determine_capabilities(item, facility_type)
+            capabilities = self._determine_capabilities(description, facility_type)
             
             # Extract contact information
             contact_info = {
@@ -203,7 +247,7 @@ class LocationIntelligence:
             }
             
             # Determine specialties
-            specialties = self._extract_specialties(item, facility_type)
+            specialties = self._extract_specialties(description, facility_type)
             
             return EmergencyFacility(
                 id=item.get("placeId", f"{facility_type}_{hash(name)}"),
@@ -242,67 +286,25 @@ class LocationIntelligence:
         emergency_speed = 60  # km/h average for emergency vehicles
         return max(1, int((distance_km / emergency_speed) * 60))
     
-    def _determine_capabilities(self, item: Dict[str, Any], facility_type: str) -> List[str]:
-        """Determine facility capabilities from description"""
-        description = (item.get("description", "") + " " + item.get("title", "")).lower()
-        
-        capabilities_map = {
-            "hospitals": {
-                "emergency_department": ["emergency", "er", "trauma"],
-                "intensive_care": ["icu", "intensive", "critical care"],
-                "cardiac_care": ["cardiac", "heart", "cardiology"],
-                "trauma_center": ["trauma", "level 1", "level i"],
-                "stroke_center": ["stroke", "neurology"],
-                "maternity": ["maternity", "obstetrics", "birth"]
-            },
-            "fire_stations": {
-                "structure_fire": ["structure", "building"],
-                "wildfire": ["wildfire", "forest", "brush"],
-                "hazmat": ["hazmat", "hazardous", "chemical"],
-                "rescue": ["rescue", "technical rescue"],
-                "medical": ["ems", "ambulance", "medical"]
-            },
-            "police_stations": {
-                "patrol": ["patrol", "response"],
-                "detective": ["detective", "investigation"],
-                "swat": ["swat", "tactical", "special"],
-                "traffic": ["traffic", "highway"]
-            }
-        }
-        
+    def _determine_capabilities(self, description: str, facility_type: str) -> List[str]:
+        """Determine facility capabilities from a pre-lowercased description"""
         capabilities = []
-        facility_capabilities = capabilities_map.get(facility_type, {})
-        
+        facility_capabilities = _CAPABILITIES_MAP.get(facility_type, {})
+
         for capability, keywords in facility_capabilities.items():
             if any(keyword in description for keyword in keywords):
                 capabilities.append(capability)
-        
+
         # Default capabilities if none detected
         if not capabilities:
-            defaults = {
-                "hospitals": ["emergency_department"],
-                "fire_stations": ["structure_fire", "medical"],
-                "police_stations": ["patrol"]
-            }
-            capabilities = defaults.get(facility_type, [])
-        
+            capabilities = _DEFAULT_CAPABILITIES.get(facility_type, [])
+
         return capabilities
     
-    def _extract_specialties(self, item: Dict[str, Any], facility_type: str) -> List[str]:
-        """Extract medical specialties or service specialties"""
-        description = (item.get("description", "") + " " + item.get("title", "")).lower()
-        
-        specialty_keywords = {
-            "cardiology": ["cardiology", "heart", "cardiac"],
-            "neurology": ["neurology", "brain", "stroke", "neuro"],
-            "trauma_surgery": ["trauma", "surgery", "surgical"],
-            "pediatrics": ["pediatric", "children", "kids"],
-            "emergency_medicine": ["emergency", "er", "trauma"],
-            "orthopedics": ["orthopedic", "bone", "joint"]
-        }
-        
+    def _extract_specialties(self, description: str, facility_type: str) -> List[str]:
+        """Extract medical specialties from a pre-lowercased description"""
         specialties = []
-        for specialty, keywords in specialty_keywords.items():
+        for specialty, keywords in _SPECIALTY_KEYWORDS.items():
             if any(keyword in description for keyword in keywords):
                 specialties.append(specialty)
         
@@ -311,10 +313,10 @@ class LocationIntelligence:
     def _assess_availability(self, item: Dict[str, Any]) -> str:
         """Assess facility availability status"""
         # Check if it's currently open
-        hours = item.get("openingHours", "")
-        if "24" in hours or "always open" in hours.lower():
+        hours = item.get("openingHours", "").lower()
+        if "24" in hours or "always open" in hours:
             return "available_24_7"
-        elif "closed" in hours.lower():
+        elif "closed" in hours:
             return "closed"
         else:
             return "available"
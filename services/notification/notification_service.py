@@ -1,16 +1,11 @@
 from typing import Dict, List, Optional, Any
-import aiosmtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+import asyncio
 import os
-import json
-import redis
+import orjson
+from redis.asyncio import Redis as AsyncRedis
 from fastapi import WebSocket
-from datetime import datetime
-from database.models import Notification, NotificationSubscription, Emergency
-from database.connection import get_db
-import smtplib
-import aioredis
+from sqlalchemy import insert
+from database.models import Notification
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -18,24 +13,80 @@ load_dotenv()
 class NotificationService:
     def __init__(self):
         """Initialize the notification service"""
-        pass
+        self._redis = AsyncRedis.from_url(
+            os.getenv("REDIS_URL", "redis://localhost:6379")
+        )
+        # Local WebSocket subscribers per channel; sends reuse the same
+        # pre-serialized payload bytes as the Redis publish
+        self._subscribers: Dict[str, set] = {}
+        self._debug = os.getenv("DEBUG", "").lower() in ("1", "true")
 
-    async def send_notification(self, channel: str, data: Dict[str, Any]):
+    def subscribe(self, channel: str, websocket: WebSocket):
+        """Register a WebSocket for a channel's notifications"""
+        self._subscribers.setdefault(channel, set()).add(websocket)
+
+    def unsubscribe(self, channel: str, websocket: WebSocket):
+        """Remove a WebSocket from a channel"""
+        self._subscribers.get(channel, set()).discard(websocket)
+
+    async def send_notification(
+        self,
+        channel: str = None,
+        data: Dict[str, Any] = None,
+        notification_type: str = None
+    ):
         """
         Send a notification to a channel
-        
+
         Args:
             channel: Channel to send notification to
             data: Data to send
+            notification_type: Alias for channel used by the coordinators
         """
+        channel = channel or notification_type or "notifications"
         try:
-            # For testing purposes, just print the notification
-            print(f"Sending notification to {channel}: {json.dumps(data)}")
+            # Serialize once; Redis and every WebSocket get the same bytes
+            payload = orjson.dumps(data)
+
+            if self._debug:
+                print(f"Sending notification to {channel}: {payload.decode()}")
+
+            await self._redis.publish(channel, payload)
+
+            subscribers = self._subscribers.get(channel)
+            if subscribers:
+                await asyncio.gather(
+                    *(ws.send_bytes(payload) for ws in subscribers),
+                    return_exceptions=True
+                )
             return True
         except Exception as e:
             print(f"Failed to send notification: {str(e)}")
             return False
 
+    async def persist_notifications(self, db, notifications: List[Dict[str, Any]]) -> int:
+        """
+        Persist a batch of notification rows with a single multi-row INSERT
+
+        Args:
+            db: Async database session
+            notifications: List of Notification column dicts
+
+        Returns:
+            Number of rows inserted
+        """
+        if not notifications:
+            return 0
+        try:
+            # One INSERT ... VALUES (...), (...) instead of one round-trip per row
+            await db.execute(insert(Notification), notifications)
+            await db.commit()
+            return len(notifications)
+        except Exception as e:
+            await db.rollback()
+            print(f"Failed to persist notifications: {str(e)}")
+            return 0
+
     async def get_notifications(self, channel: str) -> list:
         """
         Get notifications from a channel
@@ -1,15 +1,387 @@
 from google.cloud import translate
+from google.cloud.translate_v3.types import TranslateTextRequest
+from google.api_core import exceptions as gexc
+from google.api_core import retry as gretry
+from google.api_core.retry_async import AsyncRetry
+from collections import OrderedDict
+from types import SimpleNamespace
+import asyncio
+import functools
+import google.auth
+from google.auth.transport.requests import Request as GoogleAuthRequest
+import httpx
+import hashlib
 import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
 from typing import Optional
 
+# Resolved once at import: every request references the same interned
+# parent string instead of re-reading the environment per instance
+_PROJECT_ID = os.getenv("GOOGLE_CLOUD_PROJECT_ID")
+_PARENT = sys.intern(f"projects/{_PROJECT_ID}")
+
+# Base request dict shared by every RPC; call sites splat it and add
+# their contents/language codes
+_REQ_TEMPLATE = {"parent": _PARENT}
+
+# Sentence boundary for chunking oversized texts; covers Latin and CJK
+# terminal punctuation
+_SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?。！？])\s+')
+
+# Language codes treated as already-English: no translation needed
+_EN_LOCALES = frozenset({"en", "en-us", "en-gb", "en-au", "en-ca"})
+
+# Exponential backoff for transient failures: quota bursts (429),
+# unavailability (503) and per-attempt deadline misses retry with jitter
+# until the 15 s budget runs out, instead of failing the whole report
+_RETRY = AsyncRetry(
+    predicate=gretry.if_exception_type(
+        gexc.ResourceExhausted,
+        gexc.ServiceUnavailable,
+        gexc.DeadlineExceeded
+    ),
+    initial=0.25,
+    maximum=4.0,
+    multiplier=2.0,
+    timeout=15.0
+)
+
+@functools.lru_cache(maxsize=64)
+def _request_template(source_language: Optional[str], target_language: str) -> TranslateTextRequest:
+    """Partial TranslateTextRequest with everything but contents filled in
+
+    Language pairs recur constantly, so the parent and language codes are
+    parsed and validated into a proto once per pair; per-call work shrinks
+    to one small CopyFrom plus appending contents, instead of a full
+    dict-to-proto conversion.
+    """
+    request = TranslateTextRequest(
+        parent=_PARENT,
+        target_language_code=target_language
+    )
+    if source_language:
+        request.source_language_code = source_language
+    return request
+
+class TranslationError(Exception):
+    """Raised when a Cloud Translation RPC fails
+
+    The original google.api_core exception is preserved as __cause__ so
+    callers can still inspect the gRPC status. ResourceExhausted (429) is
+    never wrapped: it propagates as-is so callers can back off instead of
+    retrying immediately.
+    """
+
+# One process-wide gRPC client, built lazily: channel setup, TLS handshake
+# and credential lookup happen once, and every TranslationService instance
+# shares the same multiplexed HTTP/2 channel
+_CLIENT: Optional[translate.TranslationServiceClient] = None
+_CLIENT_LOCK = threading.Lock()
+
+# Async counterpart used on the request path: awaiting the RPC frees the
+# event loop for the full network round trip instead of blocking it
+_ASYNC_CLIENT: Optional[translate.TranslationServiceAsyncClient] = None
+_ASYNC_CLIENT_LOCK = threading.Lock()
+
+# REST backend resources: a pooled HTTP/2 client and application-default
+# credentials, shared process-wide like the gRPC clients. For tiny
+# one-shot payloads REST skips gRPC's channel warmup and proto marshal
+_REST_ENDPOINT = "https://translation.googleapis.com/v3"
+_REST_SCOPES = ("https://www.googleapis.com/auth/cloud-translation",)
+_REST_CLIENT: Optional[httpx.AsyncClient] = None
+_REST_CREDENTIALS = None
+_REST_LOCK = threading.Lock()
+
+class DiskTranslationCache:
+    """SQLite-backed translation cache that survives process restarts
+
+    The in-memory LRU is lost on every redeploy or autoscale event, so a
+    restart re-pays the Google bill for phrases the process has already
+    translated. One WAL database keyed on (source, target, text) covers
+    all language pairs, since the source is usually auto-detected.
+    """
+
+    # Google permits serving cached translations for up to 48 h
+    _TTL_SECONDS = 172_800
+
+    def __init__(self, path: Optional[str] = None):
+        if path is None:
+            cache_dir = Path.home() / ".cache" / "rapidresponse"
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            path = str(cache_dir / "translation_cache.db")
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            # WAL lets reads proceed while a write commits
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key BLOB PRIMARY KEY, translated TEXT, detected TEXT, ts INTEGER)"
+            )
+            self._conn.commit()
+
+    @staticmethod
+    def _key(text: str, source_language: Optional[str], target_language: str) -> bytes:
+        raw = f"{source_language or ''}|{target_language}|{text}"
+        return hashlib.sha1(raw.encode()).digest()
+
+    def get(
+        self,
+        text: str,
+        source_language: Optional[str],
+        target_language: str
+    ) -> Optional[dict]:
+        """Return the stored translation, or None if absent or expired"""
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT translated, detected, ts FROM cache WHERE key = ?",
+                    (self._key(text, source_language, target_language),)
+                ).fetchone()
+            if row is None or row[2] < time.time() - self._TTL_SECONDS:
+                return None
+            return {"translated_text": row[0], "detected_language": row[1]}
+        except Exception:
+            return None
+
+    def put(
+        self,
+        text: str,
+        source_language: Optional[str],
+        target_language: str,
+        translated: str,
+        detected: str
+    ):
+        """Store a translation result"""
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?)",
+                    (
+                        self._key(text, source_language, target_language),
+                        translated,
+                        detected,
+                        int(time.time())
+                    )
+                )
+                self._conn.commit()
+        except Exception as e:
+            print(f"Translation disk cache write failed: {str(e)}")
+
+    def sweep(self):
+        """Delete entries older than the TTL"""
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "DELETE FROM cache WHERE ts < ?",
+                    (int(time.time()) - self._TTL_SECONDS,)
+                )
+                self._conn.commit()
+        except Exception as e:
+            print(f"Translation disk cache sweep failed: {str(e)}")
+
+class _Coalescer:
+    """Folds concurrent single-text translate calls into shared RPCs
+
+    Calls landing within the flush window are grouped by (source, target)
+    pair and sent as one multi-contents translate_text request; results
+    fan back out through per-call futures. Callers keep the one-text API
+    while burst traffic is billed and transported as a batch.
+    """
+
+    # How long the first call in a batch waits for company
+    _WINDOW_S = 0.008
+
+    def __init__(self, service):
+        self._service = service
+        self._pending = {}
+        self._handle = None
+
+    async def submit(self, text: str, source_language: Optional[str], target_language: str):
+        """Queue one text and await its translation from the shared RPC"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.setdefault((source_language, target_language), []).append((text, future))
+        if self._handle is None:
+            self._handle = loop.call_later(self._WINDOW_S, self._flush)
+        return await future
+
+    def _flush(self):
+        """Fire one batch task per language pair collected this window"""
+        self._handle = None
+        pending, self._pending = self._pending, {}
+        for (source_language, target_language), items in pending.items():
+            asyncio.ensure_future(
+                self._run_batch(source_language, target_language, items)
+            )
+
+    async def _run_batch(self, source_language, target_language, items):
+        request = TranslateTextRequest()
+        request._pb.CopyFrom(
+            _request_template(source_language, target_language)._pb
+        )
+        request.contents.extend(text for text, _ in items)
+        try:
+            response = await self._service._translate_text(request)
+            for (_, future), translation in zip(items, response.translations):
+                if not future.done():
+                    future.set_result(translation)
+        except Exception as e:
+            for _, future in items:
+                if not future.done():
+                    future.set_exception(e)
+
 class TranslationService:
-    def __init__(self):
+    # Bounded LRU of past RPC results; repeated inputs (retries, duplicate
+    # reports, recurring phrases) skip the paid network round trip
+    _CACHE_MAXSIZE = 10_000
+
+    def __init__(self, backend: str = "grpc"):
         """
         Initialize the translation service with Google Cloud Translation
+
+        Args:
+            backend: "grpc" (default) or "rest". With "rest", single-text
+                     translations go over a pooled HTTP/2 REST connection,
+                     which avoids gRPC channel warmup for tiny payloads;
+                     batch requests stay on gRPC either way.
+        """
+        self.backend = backend
+        self.client = self._get_client()
+        self.async_client = self._get_async_client()
+        self.project_id = _PROJECT_ID
+        self.parent = _PARENT
+        # Cap outstanding RPCs so a burst cannot open unbounded streams
+        self._rpc_semaphore = asyncio.Semaphore(32)
+        self._cache = OrderedDict()
+        self._cache_lock = asyncio.Lock()
+        self._disk_cache = DiskTranslationCache()
+        # Periodic TTL sweep; started lazily since no loop runs at init
+        self._sweep_task = None
+        # Coalesces concurrent single-text translate calls into shared RPCs
+        self._coalescer = _Coalescer(self)
+
+    @classmethod
+    def _get_client(cls) -> translate.TranslationServiceClient:
+        """Return the shared client, constructing it on first use"""
+        global _CLIENT
+        if _CLIENT is None:
+            with _CLIENT_LOCK:
+                if _CLIENT is None:
+                    _CLIENT = translate.TranslationServiceClient()
+        return _CLIENT
+
+    @classmethod
+    def _get_async_client(cls) -> translate.TranslationServiceAsyncClient:
+        """Return the shared async client, constructing it on first use"""
+        global _ASYNC_CLIENT
+        if _ASYNC_CLIENT is None:
+            with _ASYNC_CLIENT_LOCK:
+                if _ASYNC_CLIENT is None:
+                    _ASYNC_CLIENT = translate.TranslationServiceAsyncClient()
+        return _ASYNC_CLIENT
+
+    # Per-attempt deadline; translations are small, so a slow attempt is
+    # better retried than waited on
+    _RPC_TIMEOUT = 5.0
+
+    async def _translate_text(self, request):
+        """Issue one translate_text RPC through the async client"""
+        async with self._rpc_semaphore:
+            if self.backend == "rest":
+                contents, target, source = self._request_fields(request)
+                # Batches keep gRPC, where HPACK and streaming pay off
+                if len(contents) == 1:
+                    return await self._rest_translate_text(contents, target, source)
+            return await self.async_client.translate_text(
+                request=request, retry=_RETRY, timeout=self._RPC_TIMEOUT
+            )
+
+    @staticmethod
+    def _request_fields(request):
+        """Pull (contents, target, source) out of a dict or proto request"""
+        if isinstance(request, dict):
+            return (
+                list(request["contents"]),
+                request["target_language_code"],
+                request.get("source_language_code")
+            )
+        return (
+            list(request.contents),
+            request.target_language_code,
+            request.source_language_code or None
+        )
+
+    @classmethod
+    def _get_rest_resources(cls):
+        """Return the shared REST client and credentials, built on first use"""
+        global _REST_CLIENT, _REST_CREDENTIALS
+        if _REST_CLIENT is None:
+            with _REST_LOCK:
+                if _REST_CLIENT is None:
+                    _REST_CREDENTIALS, _ = google.auth.default(scopes=list(_REST_SCOPES))
+                    _REST_CLIENT = httpx.AsyncClient(
+                        http2=True,
+                        timeout=httpx.Timeout(cls._RPC_TIMEOUT, connect=2.0),
+                        limits=httpx.Limits(max_keepalive_connections=16)
+                    )
+        return _REST_CLIENT, _REST_CREDENTIALS
+
+    async def _rest_translate_text(self, contents, target_language, source_language):
+        """POST one translateText call over the pooled REST connection
+
+        Returns an object shaped like the gRPC response (translations with
+        translated_text / detected_language_code) so callers are agnostic
+        to the backend.
         """
-        self.client = translate.TranslationServiceClient()
-        self.project_id = os.getenv("GOOGLE_CLOUD_PROJECT_ID")
-        self.parent = f"projects/{self.project_id}"
+        client, credentials = self._get_rest_resources()
+        if not credentials.valid:
+            # Token refresh is a blocking HTTP call; keep it off the loop
+            await asyncio.to_thread(credentials.refresh, GoogleAuthRequest())
+
+        body = {"contents": contents, "targetLanguageCode": target_language}
+        if source_language:
+            body["sourceLanguageCode"] = source_language
+
+        response = await client.post(
+            f"{_REST_ENDPOINT}/{_PARENT}:translateText",
+            json=body,
+            headers={"Authorization": f"Bearer {credentials.token}"}
+        )
+        response.raise_for_status()
+
+        return SimpleNamespace(translations=[
+            SimpleNamespace(
+                translated_text=t.get("translatedText", ""),
+                detected_language_code=t.get("detectedLanguageCode", "")
+            )
+            for t in response.json().get("translations", [])
+        ])
+
+    @staticmethod
+    def _text_key(text: str) -> bytes:
+        """Fixed-size hash of the text used in cache keys"""
+        return hashlib.sha1(text.encode()).digest()
+
+    async def _cache_get(self, key):
+        """Return the cached result for key, refreshing its LRU position"""
+        async with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+            return cached
+
+    async def _cache_put(self, key, value):
+        """Insert a result, evicting the least recently used past capacity"""
+        async with self._cache_lock:
+            self._cache[key] = value
+            if len(self._cache) > self._CACHE_MAXSIZE:
+                self._cache.popitem(last=False)
 
     async def translate(
         self,
@@ -28,74 +400,343 @@ class TranslationService:
         Returns:
             Dictionary containing translated text and detected language
         """
+        # Same-language calls need no RPC at all: return the text unchanged
+        if source_language and source_language.lower() == target_language.lower():
+            return {
+                "translated_text": text,
+                "detected_language": source_language,
+                "source_language": source_language,
+                "target_language": target_language
+            }
+
+        key = (self._text_key(text), source_language, target_language)
+        if (cached := await self._cache_get(key)) is not None:
+            return cached
+
+        # LRU miss: the disk cache may still remember this text from a
+        # previous process. sqlite reads and commits block, so they run
+        # on the thread pool like the sweep does
+        self._ensure_sweep_task()
+        stored = await asyncio.to_thread(
+            self._disk_cache.get, text, source_language, target_language
+        )
+        if stored is not None:
+            result = {
+                "translated_text": stored["translated_text"],
+                "detected_language": stored["detected_language"],
+                "source_language": source_language or stored["detected_language"],
+                "target_language": target_language
+            }
+            await self._cache_put(key, result)
+            return result
+
+        try:
+            # Long transcriptions would trip the API's per-text code-point
+            # limit; split them on sentence boundaries and send all chunks
+            # in the same request
+            contents = (
+                self._split_for_translate(text)
+                if len(text) > self._MAX_TEXT_CHARS
+                else [text]
+            )
+
+            if len(contents) == 1:
+                # The common single-text case goes through the coalescer,
+                # sharing one RPC with any concurrent same-pair callers
+                translations = [
+                    await self._coalescer.submit(text, source_language, target_language)
+                ]
+            else:
+                # Chunked oversized texts keep their own request; copy the
+                # cached per-pair template and append the contents (CopyFrom
+                # works on the underlying pb since proto-plus wraps it)
+                request = TranslateTextRequest()
+                request._pb.CopyFrom(
+                    _request_template(source_language, target_language)._pb
+                )
+                request.contents.extend(contents)
+                response = await self._translate_text(request)
+                translations = list(response.translations)
+
+            # Extract translation, rejoining chunks in order
+            translated_text = " ".join(t.translated_text for t in translations)
+            detected = translations[0].detected_language_code
+
+            result = {
+                "translated_text": translated_text,
+                "detected_language": detected,
+                "source_language": source_language or detected,
+                "target_language": target_language
+            }
+            await self._cache_put(key, result)
+            await asyncio.to_thread(
+                self._disk_cache.put,
+                text,
+                source_language,
+                target_language,
+                translated_text,
+                detected
+            )
+            return result
+
+        except gexc.ResourceExhausted:
+            raise
+        except Exception as e:
+            raise TranslationError("Translation failed") from e
+
+    # Per-text ceiling before sentence chunking kicks in; well under the
+    # API's recommended 5K code points per text
+    _MAX_TEXT_CHARS = 4000
+
+    @classmethod
+    def _split_for_translate(cls, text: str, max_cp: int = _MAX_TEXT_CHARS) -> list:
+        """Split text on sentence boundaries into chunks of at most max_cp
+
+        Sentences are packed greedily; a single sentence longer than
+        max_cp is split hard rather than sent oversized.
+        """
+        chunks = []
+        current = ""
+        for sentence in _SENTENCE_BOUNDARY.split(text):
+            while len(sentence) > max_cp:
+                if current:
+                    chunks.append(current)
+                    current = ""
+                chunks.append(sentence[:max_cp])
+                sentence = sentence[max_cp:]
+            if current and len(current) + 1 + len(sentence) > max_cp:
+                chunks.append(current)
+                current = sentence
+            else:
+                current = f"{current} {sentence}" if current else sentence
+        if current:
+            chunks.append(current)
+        return chunks
+
+    def _ensure_sweep_task(self):
+        """Start the hourly disk-cache TTL sweep on the running loop"""
+        if self._sweep_task is None or self._sweep_task.done():
+            self._sweep_task = asyncio.create_task(self._sweep_worker())
+
+    async def _sweep_worker(self):
+        while True:
+            await asyncio.to_thread(self._disk_cache.sweep)
+            await asyncio.sleep(3600)
+
+    # API limits per translate_text request; chunking stays safely under
+    # the documented 30K code-point ceiling
+    _MAX_BATCH_ITEMS = 100
+    _MAX_BATCH_CHARS = 25_000
+
+    async def translate_many(
+        self,
+        texts: list,
+        target_language: str = "en",
+        source_language: Optional[str] = None
+    ) -> list:
+        """
+        Translate many texts using as few API calls as the limits allow
+
+        Texts are packed greedily into chunks of at most _MAX_BATCH_ITEMS
+        strings or _MAX_BATCH_CHARS characters, one RPC per chunk, so bulk
+        workloads pay O(chunks) network round trips instead of O(texts).
+
+        Args:
+            texts: List of texts to translate
+            target_language: Target language code (e.g., 'en', 'es')
+            source_language: Source language code (optional)
+
+        Returns:
+            List of dictionaries, one per input text, in input order
+        """
+        if not texts:
+            return []
+
+        chunks = []
+        chunk = []
+        chunk_chars = 0
+        for text in texts:
+            if chunk and (
+                len(chunk) >= self._MAX_BATCH_ITEMS
+                or chunk_chars + len(text) > self._MAX_BATCH_CHARS
+            ):
+                chunks.append(chunk)
+                chunk = []
+                chunk_chars = 0
+            chunk.append(text)
+            chunk_chars += len(text)
+        chunks.append(chunk)
+
+        results = []
+        for chunk in chunks:
+            results.extend(
+                await self.translate_batch(chunk, target_language, source_language)
+            )
+        return results
+
+    async def translate_batch(
+        self,
+        texts: list,
+        target_language: str = "en",
+        source_language: Optional[str] = None
+    ) -> list:
+        """
+        Translate several texts in a single API call
+
+        Args:
+            texts: List of texts to translate
+            target_language: Target language code (e.g., 'en', 'es')
+            source_language: Source language code (optional)
+
+        Returns:
+            List of dictionaries, one per input text, in input order
+        """
+        if not texts:
+            return []
         try:
-            # Create translation request
             request = {
-                "parent": self.parent,
-                "contents": [text],
+                **_REQ_TEMPLATE,
+                "contents": list(texts),
                 "target_language_code": target_language,
             }
-            
-            # Add source language if provided
+
             if source_language:
                 request["source_language_code"] = source_language
 
-            # Perform translation
-            response = self.client.translate_text(request=request)
-            
-            # Extract translation
-            translation = response.translations[0]
-            
-            return {
-                "translated_text": translation.translated_text,
-                "detected_language": translation.detected_language_code,
-                "source_language": source_language or translation.detected_language_code,
-                "target_language": target_language
+            response = await self._translate_text(request)
+
+            return [
+                {
+                    "translated_text": translation.translated_text,
+                    "detected_language": translation.detected_language_code,
+                    "source_language": source_language or translation.detected_language_code,
+                    "target_language": target_language
+                }
+                for translation in response.translations
+            ]
+
+        except gexc.ResourceExhausted:
+            raise
+        except Exception as e:
+            raise TranslationError("Batch translation failed") from e
+
+    async def detect_language_batch(self, texts: list) -> list:
+        """
+        Detect the language of several texts in a single API call
+
+        Args:
+            texts: List of texts to detect language for
+
+        Returns:
+            List of dictionaries, one per input text, in input order
+        """
+        if not texts:
+            return []
+        try:
+            request = {
+                **_REQ_TEMPLATE,
+                "contents": list(texts),
+                "target_language_code": "en"
             }
-            
+
+            response = await self._translate_text(request)
+
+            return [
+                {
+                    "language": translation.detected_language_code,
+                    "confidence": 1.0  # Translation API doesn't provide confidence
+                }
+                for translation in response.translations
+            ]
+
+        except gexc.ResourceExhausted:
+            raise
         except Exception as e:
-            raise Exception(f"Translation failed: {str(e)}")
+            raise TranslationError("Batch language detection failed") from e
+
+    async def detect_and_translate(self, text: str, target_language: str = "en") -> dict:
+        """
+        Detect the source language and translate in a single API call
+
+        translate_text already returns detected_language_code alongside the
+        translation, so callers that detect and then translate pay two RPCs
+        for one logical operation; this fuses them into one.
+
+        Args:
+            text: Text to detect and translate
+            target_language: Target language code (e.g., 'en', 'es')
+
+        Returns:
+            Dictionary containing detected language, translated text,
+            and confidence
+        """
+        result = await self.translate(text, target_language=target_language)
+        return {
+            "detected_language": result["detected_language"],
+            "translated_text": result["translated_text"],
+            "confidence": 1.0  # Translation API doesn't provide confidence
+        }
 
     async def detect_language(self, text: str) -> dict:
         """
         Detect the language of the text
-        
+
+        Deprecated: this costs a full translate_text RPC just to read the
+        detected language. Callers that translate afterwards should use
+        detect_and_translate and get both for one RPC.
+
         Args:
             text: Text to detect language for
-            
+
         Returns:
             Dictionary containing language code and confidence
         """
+        # A text's language never changes, so detection caches on the
+        # text hash alone
+        key = self._text_key(text)
+        if (cached := await self._cache_get(key)) is not None:
+            return cached
+
         try:
             # Create translation request with target language same as source
             # This is a workaround since the detect_language API is not working
             request = {
-                "parent": self.parent,
+                **_REQ_TEMPLATE,
                 "contents": [text],
                 "target_language_code": "en"
             }
-            
-            response = self.client.translate_text(request=request)
-            
+
+            response = await self._translate_text(request)
+
             # Get the language from the first translation
             translation = response.translations[0]
-            
-            return {
+
+            result = {
                 "language": translation.detected_language_code,
                 "confidence": 1.0  # Translation API doesn't provide confidence
             }
-            
+            await self._cache_put(key, result)
+            return result
+
+        except gexc.ResourceExhausted:
+            raise
         except Exception as e:
-            raise Exception(f"Language detection failed: {str(e)}")
+            raise TranslationError("Language detection failed") from e
 
-    def is_translation_needed(self, detected_language: str) -> bool:
+    @staticmethod
+    def is_translation_needed(detected_language: str) -> bool:
         """
         Determine if translation is needed based on detected language
-        
+
         Args:
             detected_language: Detected language code
-            
+
         Returns:
             Boolean indicating if translation is needed
         """
-        return detected_language.lower() != "en" 
\ No newline at end of file
+        # Google returns lowercase BCP-47 codes, so the common path is a
+        # pure O(1) set lookup; casefold covers uppercased caller input
+        return (
+            detected_language not in _EN_LOCALES
+            and detected_language.casefold() not in _EN_LOCALES
+        ) 
\ No newline at end of file
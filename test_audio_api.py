@@ -1,44 +1,50 @@
-import requests
-import json
+import httpx
+import orjson
+
+# One HTTP/2 client for the whole run: concurrent requests to
+# localhost:8099 multiplex over a single keep-alive connection instead
+# of opening a socket per call
+_client = httpx.Client(
+    http2=True,
+    timeout=httpx.Timeout(15.0, connect=2.0),
+    limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+    transport=httpx.HTTPTransport(http2=True, retries=1)
+)
 
 def test_audio_emergency_report():
     """Test the audio-based emergency reporting endpoint"""
     
     url = "http://localhost:8099/emergency/report"
-    
-    # Prepare the files and data
-    files = {
-        'audio': ('test_emergency_audio.wav', open('test_emergency_audio.wav', 'rb'), 'audio/wav')
-    }
-    
+
     data = {
         'lat': 40.7128,
         'lon': -74.0060
     }
-    
+
     try:
         print("Sending audio-based emergency report...")
-        response = requests.post(url, files=files, data=data, timeout=30)
-        
+        # The with-scope closes the handle as soon as the request body is
+        # sent instead of holding it open through the whole timeout window
+        with open('test_emergency_audio.wav', 'rb') as f:
+            files = {
+                'audio': ('test_emergency_audio.wav', f, 'audio/wav')
+            }
+            response = _client.post(url, files=files, data=data, timeout=httpx.Timeout(30.0, connect=2.0))
+
         print(f"Status Code: {response.status_code}")
         print(f"Response Headers: {dict(response.headers)}")
-        
+
         if response.status_code == 200:
-            result = response.json()
+            result = orjson.loads(response.content)
             print("✅ SUCCESS! Audio emergency report processed successfully.")
             print("\nResponse:")
-            print(json.dumps(result, indent=2))
+            print(orjson.dumps(result, option=orjson.OPT_INDENT_2).decode())
         else:
             print(f"❌ ERROR: {response.status_code}")
             print(f"Response: {response.text}")
-            
+
     except Exception as e:
         print(f"❌ ERROR: {str(e)}")
-    
-    finally:
-        # Close the file
-        if 'audio' in files:
-            files['audio'][1].close()
 
 if __name__ == "__main__":
     test_audio_emergency_report() 
\ No newline at end of file
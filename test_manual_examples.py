@@ -164,7 +164,7 @@ def test_api_endpoints():
         # Test emergency history
         history_response = requests.get(f"{BASE_URL}/emergency/history?limit=3")
         if history_response.status_code == 200:
-            history = history_response.json()
+            history = history_response.json()["items"]
             print(f"\n📜 Recent Emergencies ({len(history)} shown):")
             for i, emergency in enumerate(history[:3]):
                 print(f"  {i+1}. {emergency.get('emergency_type', 'UNKNOWN')} - {emergency.get('priority_level', 'UNKNOWN')} priority")
@@ -1,10 +1,20 @@
-import requests
-import json
+import httpx
+import orjson
+
+# One HTTP/2 client for the whole run: concurrent requests to
+# localhost:8099 multiplex over a single keep-alive connection instead
+# of opening a socket per call
+_client = httpx.Client(
+    http2=True,
+    timeout=httpx.Timeout(15.0, connect=2.0),
+    limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+    transport=httpx.HTTPTransport(http2=True, retries=1)
+)
 
 def test_health():
     """Test the health endpoint"""
     try:
-        response = requests.get("http://localhost:8099/health", timeout=5)
+        response = _client.get("http://localhost:8099/health", timeout=httpx.Timeout(5.0, connect=2.0))
         print(f"Health check: {response.status_code} - {response.text}")
     except Exception as e:
         print(f"Health check failed: {e}")
@@ -17,10 +27,10 @@ def test_simple_text():
             'lat': 40.7128,
             'lon': -74.0060
         }
-        response = requests.post("http://localhost:8099/emergency/report", data=data, timeout=10)
+        response = _client.post("http://localhost:8099/emergency/report", data=data, timeout=httpx.Timeout(10.0, connect=2.0))
         print(f"Text emergency: {response.status_code}")
         if response.status_code == 200:
-            print(json.dumps(response.json(), indent=2))
+            print(orjson.dumps(orjson.loads(response.content), option=orjson.OPT_INDENT_2).decode())
         else:
             print(response.text)
     except Exception as e: